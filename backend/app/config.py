@@ -44,9 +44,11 @@ class Config:
     # Bot Parameters
     TRADING_ENABLED = os.getenv('TRADING_ENABLED', 'true').lower() == 'true'
     TRADING_INTERVAL = int(os.getenv('TRADING_INTERVAL', 3600))  # 1 hour in seconds
+    PERSIST_HOLD_CYCLES = os.getenv('PERSIST_HOLD_CYCLES', 'true').lower() == 'true'  # false = only save cycles with an action/error
 
     # Database
     DATABASE_URL = os.getenv('DATABASE_URL', 'sqlite:///./botija-crypto.db')
+    CYCLE_ORM_INSERTS = os.getenv('CYCLE_ORM_INSERTS', 'false').lower() == 'true'  # Debug: ORM instead of Core inserts for cycles
 
     # API
     API_HOST = os.getenv('API_HOST', '0.0.0.0')
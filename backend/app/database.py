@@ -2,7 +2,7 @@
 Database configuration for Botija Crypto
 """
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 import os
@@ -12,10 +12,30 @@ from pathlib import Path
 _DEFAULT_DB_PATH = Path(__file__).parent.parent / "botija-crypto.db"
 DATABASE_URL = os.getenv("DATABASE_URL", f"sqlite:///{_DEFAULT_DB_PATH}")
 
-engine = create_engine(
-    DATABASE_URL,
-    connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {}
-)
+if "sqlite" in DATABASE_URL:
+    engine = create_engine(
+        DATABASE_URL,
+        connect_args={"check_same_thread": False}
+    )
+
+    @event.listens_for(engine, "connect")
+    def _sqlite_pragmas(dbapi_connection, connection_record):
+        """WAL lets dashboard reads run alongside cycle writes; NORMAL sync is
+        crash-safe in WAL mode and skips an fsync per commit"""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+else:
+    # Server databases: keep pooled connections alive across cycles, but
+    # validate on checkout and recycle before typical server idle timeouts
+    engine = create_engine(
+        DATABASE_URL,
+        pool_size=5,
+        max_overflow=5,
+        pool_pre_ping=True,
+        pool_recycle=1800
+    )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -8,6 +8,7 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 import os
 import logging
+import threading
 from contextlib import asynccontextmanager
 
 # Import scheduler
@@ -22,6 +23,15 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+def _warm_up_kernels():
+    """JIT-compile indicator kernels so the first trading cycle runs at full speed"""
+    from .services import technical_indicators, trading_bot
+    try:
+        technical_indicators.warm_up_kernels()
+        trading_bot.warm_up_kernels()
+    except Exception as e:
+        logger.warning(f"Kernel warm-up failed: {e}")
+
 # Lifespan events
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -30,10 +40,14 @@ async def lifespan(app: FastAPI):
     Base.metadata.create_all(bind=engine)  # Create tables
     setup_log_handler()  # Setup in-memory log handler
     init_scheduler()
+    # Compile the numba kernels off the startup path (no-op without numba)
+    threading.Thread(target=_warm_up_kernels, name="jit-warmup", daemon=True).start()
     logger.info("🚀 Botija Crypto iniciado")
     yield
     # Shutdown
     shutdown_scheduler()
+    if bot.trading_bot:
+        bot.trading_bot.flush_cycles()  # Persist queued cycles from manual runs
     logger.info("🛑 Botija Crypto detenido")
 
 # Create FastAPI app
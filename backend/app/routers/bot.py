@@ -5,16 +5,19 @@ Bot router for Botija Crypto
 from fastapi import APIRouter, Depends, Query
 from fastapi.responses import Response, FileResponse
 from sqlalchemy.orm import Session
+import asyncio
 import os
 import subprocess
 from pathlib import Path
 from .. import models, schemas
 from ..database import get_db
 from ..services import TradingBot, TechnicalIndicators
+from ..services.kraken_client import get_public_client
 from ..services.modes.factory import get_trading_engine
 from ..services.modes.paper import PaperTradingEngine
 from ..scheduler import get_scheduler_status, last_cycle_info
 from ..services.log_handler import get_log_handler
+from ..services._ttl_cache import TTLCache
 from datetime import datetime
 
 router = APIRouter(
@@ -79,12 +82,14 @@ async def get_dashboard_status():
     try:
         # Get trading engine (paper or real)
         engine = get_trading_engine()
-        balances = engine.load_balances()
+        # REAL engine balances are a Kraken round-trip; keep it off the event loop
+        balances = await asyncio.to_thread(engine.load_balances)
 
         # If paper engine, get additional stats
         if isinstance(engine, PaperTradingEngine):
-            wallet = engine.get_wallet_summary()
-            position = engine.get_open_position()
+            # Blocking DB reads; run them off the event loop like the paper routes
+            wallet = await asyncio.to_thread(engine.get_wallet_summary)
+            position = await asyncio.to_thread(engine.get_open_position)
 
             return {
                 "mode": "PAPER",
@@ -232,14 +237,16 @@ async def get_market_analysis(bot: TradingBot = Depends(get_trading_bot)):
     return analysis if analysis else {"error": "Analysis failed"}
 
 @router.get("/indicators/{pair}")
-async def get_indicators(pair: str = "XBTUSDT", bot: TradingBot = Depends(get_trading_bot)):
+async def get_indicators(pair: str = "XBTUSDT"):
     """Get technical indicators for a pair"""
     try:
-        ohlc_data = bot.kraken.get_ohlc(pair)
-        if not ohlc_data:
+        # Shared public Kraken client (market data needs no credentials)
+        ohlc_data = await asyncio.to_thread(get_public_client().get_ohlc, pair)
+        if len(ohlc_data) == 0:
             return {"error": "No OHLC data available"}
 
-        closes = [float(candle[4]) for candle in ohlc_data]
+        # float64 rows of [time, open, high, low, close, ...]
+        closes = ohlc_data[:, 4]
         indicators = TechnicalIndicators.analyze_signals(closes)
 
         return indicators
@@ -331,9 +338,11 @@ async def get_trading_cycle(cycle_id: int, db: Session = Depends(get_db)):
 
 # ==================== RISK PROFILE ENDPOINTS ====================
 
-@router.get("/risk-profile")
-async def get_risk_profile(db: Session = Depends(get_db)):
-    """Get current risk profile configuration"""
+# The profile only changes through PUT /risk-profile, which refreshes this cache
+_risk_profile_cache = TTLCache(ttl=30.0)
+
+def _load_risk_profile(db: Session) -> dict:
+    """Load (or create the default) risk profile as a response dict"""
     profile = db.query(models.RiskProfile).first()
 
     if not profile:
@@ -366,6 +375,11 @@ async def get_risk_profile(db: Session = Depends(get_db)):
         "projected_monthly_return_max": presets["projected_monthly_return_max"],
     }
 
+@router.get("/risk-profile")
+async def get_risk_profile(db: Session = Depends(get_db)):
+    """Get current risk profile configuration"""
+    return dict(_risk_profile_cache.get_or('profile', lambda: _load_risk_profile(db)))
+
 @router.put("/risk-profile")
 async def update_risk_profile(
     update: schemas.RiskProfileUpdate,
@@ -406,7 +420,7 @@ async def update_risk_profile(
 
     presets = schemas.RISK_PRESETS.get(profile.profile, schemas.RISK_PRESETS["moderate"])
 
-    return {
+    result = {
         "id": profile.id,
         "profile": profile.profile,
         "buy_score_threshold": profile.buy_score_threshold,
@@ -417,8 +431,10 @@ async def update_risk_profile(
         "updated_at": profile.updated_at,
         "projected_monthly_return_min": presets.get("projected_monthly_return_min", 5.0),
         "projected_monthly_return_max": presets.get("projected_monthly_return_max", 10.0),
-        "message": f"Risk profile updated to {profile.profile}"
     }
+    _risk_profile_cache.set('profile', result)
+
+    return {**result, "message": f"Risk profile updated to {profile.profile}"}
 
 @router.get("/risk-presets")
 async def get_risk_presets():
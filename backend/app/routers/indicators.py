@@ -2,6 +2,7 @@
 Indicators router for technical analysis endpoints
 """
 
+import asyncio
 from fastapi import APIRouter, Query
 from typing import List
 from ..services import TechnicalIndicators
@@ -15,7 +16,7 @@ router = APIRouter(
 async def calculate_ema(data: List[float], period: int = 20):
     """Calculate Exponential Moving Average"""
     try:
-        ema = TechnicalIndicators.calculate_ema(data, period)
+        ema = TechnicalIndicators.calculate_ema(data, period).tolist()
         return {
             "indicator": "EMA",
             "period": period,
@@ -29,7 +30,7 @@ async def calculate_ema(data: List[float], period: int = 20):
 async def calculate_rsi(data: List[float], period: int = 14):
     """Calculate Relative Strength Index"""
     try:
-        rsi = TechnicalIndicators.calculate_rsi(data, period)
+        rsi = TechnicalIndicators.calculate_rsi(data, period).tolist()
         return {
             "indicator": "RSI",
             "period": period,
@@ -50,8 +51,8 @@ async def calculate_macd(
 ):
     """Calculate MACD indicator"""
     try:
-        macd_line, signal_line, histogram = TechnicalIndicators.calculate_macd(
-            data, fast, slow, signal
+        macd_line, signal_line, histogram = (
+            values.tolist() for values in TechnicalIndicators.calculate_macd(data, fast, slow, signal)
         )
         return {
             "indicator": "MACD",
@@ -76,8 +77,8 @@ async def calculate_bollinger(
 ):
     """Calculate Bollinger Bands"""
     try:
-        upper, middle, lower = TechnicalIndicators.calculate_bollinger_bands(
-            data, period, std_dev
+        upper, middle, lower = (
+            band.tolist() for band in TechnicalIndicators.calculate_bollinger_bands(data, period, std_dev)
         )
         return {
             "indicator": "Bollinger Bands",
@@ -106,27 +107,25 @@ async def analyze_signals(data: List[float]):
 async def get_current_indicators():
     """Get current market indicators for BTC/USD with AI regime parameters"""
     try:
-        from ..services import KrakenClient
         from ..services.ai_regime import AIRegimeService
-        import os
+        from ..services.kraken_client import get_public_client
 
         # Get AI regime for current week
-        ai_regime = AIRegimeService.get_current_regime()
+        # Blocking HTTP (OpenAI / Kraken) runs in worker threads, not on the loop
+        ai_regime = await asyncio.to_thread(AIRegimeService.get_current_regime)
 
-        # Initialize Kraken client
-        kraken = KrakenClient(
-            api_key=os.getenv('KRAKEN_API_KEY', ''),
-            secret_key=os.getenv('KRAKEN_SECRET_KEY', '')
-        )
+        # Shared public Kraken client (market data needs no credentials)
+        kraken = get_public_client()
 
-        # Get current price
-        price = kraken.get_current_price('XBTUSDT')
+        # Get current price (last trade close from the ticker)
+        ticker = await asyncio.to_thread(kraken.get_ticker, 'XBTUSDT')
+        price = float(ticker['c'][0]) if ticker.get('c') else 0.0
 
-        # Get historical data for indicators
-        ohlc_data = kraken.get_ohlc('XBTUSDT', interval=240, count=100)
+        # Get historical data for indicators (4h candles)
+        ohlc_data = await asyncio.to_thread(kraken.get_ohlc, 'XBTUSDT', interval=240)
 
-        if ohlc_data and len(ohlc_data) > 0:
-            close_prices = [float(candle[4]) for candle in ohlc_data]
+        if len(ohlc_data) > 0:
+            close_prices = ohlc_data[:, 4]
 
             # Use analyze_signals which includes volatility and adaptive thresholds
             analysis = TechnicalIndicators.analyze_signals(close_prices)
@@ -150,7 +149,7 @@ async def get_current_indicators():
                 "ai_capital_percent": ai_regime['capital_percent'],
                 "ai_confidence": ai_regime['confidence'],
                 "ai_reasoning": ai_regime['reasoning'],
-                "timestamp": ohlc_data[-1][0] if ohlc_data else None
+                "timestamp": int(ohlc_data[-1, 0])
             }
         else:
             return {
@@ -2,6 +2,7 @@
 Paper trading routes
 """
 
+import asyncio
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 from .. import schemas, models
@@ -19,7 +20,7 @@ paper_engine = PaperTradingEngine()
 @router.get("/wallet")
 async def get_wallet():
     """Get current paper wallet status"""
-    return paper_engine.get_wallet_summary()
+    return await asyncio.to_thread(paper_engine.get_wallet_summary)
 
 @router.get("/trades")
 async def get_paper_trades(limit: int = 20, db: Session = Depends(get_db)):
@@ -42,10 +43,10 @@ async def get_paper_trades(limit: int = 20, db: Session = Depends(get_db)):
 async def reset_wallet(initial_usd: float = 1000.0):
     """Reset paper wallet to initial state"""
     try:
-        paper_engine.reset_wallet(initial_usd)
+        await asyncio.to_thread(paper_engine.reset_wallet, initial_usd)
         return {
             "message": f"Paper wallet reset to ${initial_usd:.2f}",
-            "wallet": paper_engine.get_wallet_summary()
+            "wallet": await asyncio.to_thread(paper_engine.get_wallet_summary)
         }
     except Exception as e:
         return {"error": str(e)}
@@ -54,11 +55,12 @@ async def reset_wallet(initial_usd: float = 1000.0):
 async def simulate_buy(price: float, usd_amount: float):
     """Manually simulate a buy order"""
     try:
-        success, message = paper_engine.buy(price, usd_amount)
+        # Engine calls are blocking DB work: keep them off the event loop
+        success, message = await asyncio.to_thread(paper_engine.buy, price, usd_amount)
         return {
             "success": success,
             "message": message,
-            "wallet": paper_engine.get_wallet_summary() if success else None
+            "wallet": await asyncio.to_thread(paper_engine.get_wallet_summary) if success else None
         }
     except Exception as e:
         return {"success": False, "error": str(e)}
@@ -67,11 +69,12 @@ async def simulate_buy(price: float, usd_amount: float):
 async def simulate_sell(price: float, btc_amount: float):
     """Manually simulate a sell order"""
     try:
-        success, message = paper_engine.sell(price, btc_amount)
+        # Engine calls are blocking DB work: keep them off the event loop
+        success, message = await asyncio.to_thread(paper_engine.sell, price, btc_amount)
         return {
             "success": success,
             "message": message,
-            "wallet": paper_engine.get_wallet_summary() if success else None
+            "wallet": await asyncio.to_thread(paper_engine.get_wallet_summary) if success else None
         }
     except Exception as e:
         return {"success": False, "error": str(e)}
@@ -7,10 +7,12 @@ from apscheduler.triggers.cron import CronTrigger
 import logging
 import asyncio
 import os
-from datetime import datetime
+from datetime import datetime, timezone
 from .services.trading_bot import TradingBot
 from .services.kraken_client import KrakenClient
 from .config import Config
+from .database import SessionLocal
+from .models import BotStatus, TradingCycle
 
 logger = logging.getLogger(__name__)
 
@@ -31,9 +33,6 @@ def init_scheduler():
 
     try:
         # Load last cycle from database
-        from .database import SessionLocal
-        from .models import TradingCycle
-
         db = SessionLocal()
         try:
             last_db_cycle = db.query(TradingCycle).order_by(TradingCycle.timestamp.desc()).first()
@@ -144,15 +143,11 @@ def shutdown_scheduler():
     if scheduler.running:
         scheduler.shutdown()
         logger.info("✅ Scheduler detenido")
+    if trading_bot:
+        trading_bot.flush_cycles()
 
 def get_scheduler_status():
     """Retorna el estado actual del scheduler con countdown preciso"""
-    from datetime import datetime, timezone
-    import pytz
-    from .config import Config
-    from .database import SessionLocal
-    from .models import BotStatus
-
     # Obtener started_at desde la DB
     started_at = None
     uptime_seconds = 0
@@ -164,8 +159,7 @@ def get_scheduler_status():
             now = datetime.now(timezone.utc)
             if bot_status.started_at.tzinfo is None:
                 # Si no tiene timezone, asumir UTC
-                from datetime import timezone as tz
-                started_aware = bot_status.started_at.replace(tzinfo=tz.utc)
+                started_aware = bot_status.started_at.replace(tzinfo=timezone.utc)
             else:
                 started_aware = bot_status.started_at
             uptime_seconds = int((now - started_aware).total_seconds())
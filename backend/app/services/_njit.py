@@ -0,0 +1,31 @@
+"""
+Optional Numba JIT decorator for numeric kernels
+Falls back to plain Python when numba is not installed (slower, never broken)
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on environment
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit (supports @njit and @njit(...))"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+def as_f64(values) -> np.ndarray:
+    """Contiguous float64 view of values for kernel input (no copy when already in that layout)"""
+    return np.ascontiguousarray(values, dtype=np.float64)
+
+
+def as_f32(values) -> np.ndarray:
+    """Contiguous float32 copy of values: half the memory traffic for read-only price kernels"""
+    return np.ascontiguousarray(values, dtype=np.float32)
+
+
+__all__ = ['njit', 'as_f64', 'as_f32', 'NUMBA_AVAILABLE']
@@ -0,0 +1,59 @@
+"""
+Tiny thread-safe TTL cache for values that change rarely (DB config rows, AI answers)
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """Key -> value cache where entries expire `ttl` seconds after being stored
+
+    With `maxsize`, storing a new key evicts the oldest entry once full.
+    """
+
+    def __init__(self, ttl: float, maxsize: Optional[int] = None):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default when missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and time.monotonic() - entry[0] < self.ttl:
+                return entry[1]
+        return default
+
+    def get_or(self, key: Hashable, load: Callable[[], Any]) -> Any:
+        """Return the cached value for key, calling load() to refresh it when expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and time.monotonic() - entry[0] < self.ttl:
+                return entry[1]
+
+        value = load()
+        self.set(key, value)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value for key, restarting its TTL"""
+        with self._lock:
+            # Re-insert so dict order stays oldest-first for eviction
+            self._entries.pop(key, None)
+            if self.maxsize and len(self._entries) >= self.maxsize:
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = (time.monotonic(), value)
+
+    def invalidate(self, key: Hashable = None) -> None:
+        """Drop one key, or every key when None"""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+
+__all__ = ['TTLCache']
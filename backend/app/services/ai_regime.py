@@ -9,11 +9,20 @@ import os
 from datetime import datetime, timedelta
 from typing import Dict, Optional
 
+import pandas as pd
+
+from ..database import SessionLocal
+from ..models import AIMarketRegime
+from ._ttl_cache import TTLCache
+from .technical_indicators import TechnicalIndicators
+from .kraken_client import get_public_client
+
 logger = logging.getLogger(__name__)
 
-# Cache for current regime (refreshes weekly)
-_regime_cache: Dict = {}
-_cache_expiry: Optional[datetime] = None
+# Last live (OpenAI) regime, shared by trading cycles and dashboard requests
+REGIME_CACHE_TTL = 15 * 60  # seconds
+_regime_cache = TTLCache(ttl=REGIME_CACHE_TTL, maxsize=1)
+
 
 
 class AIRegimeService:
@@ -80,22 +89,17 @@ Respond ONLY with this JSON format:
     def _fetch_market_data(cls) -> Optional[Dict]:
         """Fetch real market data from Kraken for AI analysis"""
         try:
-            from .kraken_client import KrakenClient
-            import pandas as pd
-
-            # Use public API (no auth needed)
-            client = KrakenClient(api_key="", api_secret="")
+            # Use the shared public API client (no auth needed)
+            client = get_public_client()
 
             # Get OHLC data (daily candles, 720 = 720 days)
             ohlc = client.get_ohlc(interval=1440)  # Daily candles
-            if not ohlc or len(ohlc) < 50:
+            if len(ohlc) < 50:
                 logger.warning("Insufficient OHLC data for regime analysis")
                 return None
 
-            # Convert to DataFrame
+            # Convert to DataFrame (columns are already float64)
             df = pd.DataFrame(ohlc, columns=['time', 'open', 'high', 'low', 'close', 'vwap', 'volume', 'count'])
-            df['close'] = df['close'].astype(float)
-            df['volume'] = df['volume'].astype(float)
 
             # Current price
             price = df['close'].iloc[-1]
@@ -113,13 +117,9 @@ Respond ONLY with this JSON format:
             else:
                 change_30d = 0
 
-            # Calculate RSI
-            delta = df['close'].diff()
-            gain = delta.where(delta > 0, 0).rolling(window=14).mean()
-            loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-            rs = gain / loss
-            rsi = 100 - (100 / (1 + rs))
-            current_rsi = float(rsi.iloc[-1]) if not pd.isna(rsi.iloc[-1]) else 50
+            # Calculate RSI (14-period simple means of gains/losses); only the
+            # last value is used, so one pass over the last 14 deltas
+            current_rsi = TechnicalIndicators.calculate_rsi_last(df['close'].to_numpy(), 14)
 
             # Calculate EMAs
             ema20 = df['close'].ewm(span=20).mean().iloc[-1]
@@ -131,7 +131,7 @@ Respond ONLY with this JSON format:
             volatility = returns.tail(7).std() * 100
 
             # Volume ratio
-            vol_ma20 = df['volume'].rolling(20).mean().iloc[-1]
+            vol_ma20 = df['volume'].tail(20).mean()
             volume_ratio = df['volume'].iloc[-1] / vol_ma20 if vol_ma20 > 0 else 1.0
 
             # 52-week high/low
@@ -205,9 +205,6 @@ Respond ONLY with this JSON format:
     def _get_recent_regimes(cls, n_weeks: int = 4) -> list:
         """Get the last N weeks of regimes from DB for momentum calculation"""
         try:
-            from ..database import SessionLocal
-            from ..models import AIMarketRegime
-
             db = SessionLocal()
 
             regimes = db.query(AIMarketRegime).order_by(
@@ -277,10 +274,15 @@ Respond ONLY with this JSON format:
     def get_current_regime(cls) -> Dict:
         """
         Get AI regime parameters for the current cycle.
-        Calls OpenAI API every cycle (every 4 hours) for real-time market analysis.
+        Calls OpenAI for real-time market analysis, reusing a successful
+        answer for REGIME_CACHE_TTL seconds (manual cycles and dashboard
+        polls in between don't trigger new calls).
         Applies momentum multiplier for prolonged trends.
         """
-        # No cache - call OpenAI every cycle for real-time analysis
+        cached = _regime_cache.get('live')
+        if cached is not None:
+            return dict(cached)
+
         regime_data = cls._call_openai()
 
         if regime_data:
@@ -304,7 +306,8 @@ Respond ONLY with this JSON format:
             cls._save_to_db(result)
 
             logger.info(f"AI Regime: {result['regime']} (real-time analysis)")
-            return result
+            _regime_cache.set('live', result)
+            return dict(result)
 
         # Try to get from DB as fallback
         db_regime = cls._get_from_db()
@@ -319,9 +322,6 @@ Respond ONLY with this JSON format:
     def _save_to_db(cls, regime_data: Dict) -> None:
         """Save regime to database for history"""
         try:
-            from ..database import SessionLocal
-            from ..models import AIMarketRegime
-
             db = SessionLocal()
 
             # Calculate week start (Monday)
@@ -371,9 +371,6 @@ Respond ONLY with this JSON format:
     def _get_from_db(cls) -> Optional[Dict]:
         """Get most recent regime from database as fallback"""
         try:
-            from ..database import SessionLocal
-            from ..models import AIMarketRegime
-
             db = SessionLocal()
 
             regime = db.query(AIMarketRegime).order_by(
@@ -402,12 +399,15 @@ Respond ONLY with this JSON format:
             logger.error(f"Error getting regime from DB: {e}")
             return None
 
+    @classmethod
+    def get_stored_regime(cls) -> Dict:
+        """Latest saved regime (or defaults) without calling OpenAI"""
+        return cls._get_from_db() or cls.DEFAULT_PARAMS
+
     @classmethod
     def force_refresh(cls) -> Dict:
         """Force a fresh call to OpenAI, ignoring cache"""
-        global _regime_cache, _cache_expiry
-        _regime_cache = {}
-        _cache_expiry = None
+        _regime_cache.invalidate()
         return cls.get_current_regime()
 
     @classmethod
@@ -417,9 +417,6 @@ Respond ONLY with this JSON format:
         Used for backtesting - reads from pre-populated DB.
         """
         try:
-            from ..database import SessionLocal
-            from ..models import AIMarketRegime
-
             db = SessionLocal()
 
             regime = db.query(AIMarketRegime).filter(
@@ -4,10 +4,32 @@ Kraken API client for trading operations
 
 import krakenex
 import logging
+import threading
+import numpy as np
 from typing import Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Kraken OHLC row: time, open, high, low, close, vwap, volume, count
+OHLC_COLUMNS = 8
+
+# Process-wide unauthenticated client (see get_public_client)
+_public_client: Optional['KrakenClient'] = None
+_public_client_lock = threading.Lock()
+
+
+def get_public_client() -> 'KrakenClient':
+    """Shared public-API KrakenClient, created on first use
+
+    Reusing one instance keeps its requests session (and the keep-alive
+    connection to api.kraken.com) across calls.
+    """
+    global _public_client
+    with _public_client_lock:
+        if _public_client is None:
+            _public_client = KrakenClient(api_key="", api_secret="")
+        return _public_client
+
 class KrakenClient:
     """Kraken Spot API client"""
     
@@ -53,8 +75,13 @@ class KrakenClient:
             self.logger.error(f"Error getting ticker: {e}")
             return {}
     
-    def get_ohlc(self, pair: str = "XBTUSDT", interval: int = 60) -> List:
-        """Get OHLC data for technical analysis"""
+    def get_ohlc(self, pair: str = "XBTUSDT", interval: int = 60) -> np.ndarray:
+        """Get OHLC data for technical analysis
+
+        Returns:
+            float64 array of shape (N, 8) parsed once from Kraken's string
+            rows (empty on error), so closes are simply ohlc[:, 4]
+        """
         try:
             response = self.api.query_public('OHLC', {
                 'pair': pair,
@@ -62,11 +89,14 @@ class KrakenClient:
             })
             if response.get('error'):
                 self.logger.error(f"OHLC error: {response['error']}")
-                return []
-            return response.get('result', {}).get(pair, [])
+                return np.empty((0, OHLC_COLUMNS))
+            rows = response.get('result', {}).get(pair, [])
+            if not rows:
+                return np.empty((0, OHLC_COLUMNS))
+            return np.asarray(rows, dtype=np.float64)
         except Exception as e:
             self.logger.error(f"Error getting OHLC: {e}")
-            return []
+            return np.empty((0, OHLC_COLUMNS))
     
     def place_limit_order(
         self, 
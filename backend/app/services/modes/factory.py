@@ -3,7 +3,7 @@ Trading engine factory
 """
 
 import logging
-from typing import Union
+from typing import Optional, Tuple, Union
 from .base import TradingEngine
 from .real import RealTradingEngine
 from .paper import PaperTradingEngine
@@ -12,6 +12,11 @@ from ..trading_mode import MODE
 
 logger = logging.getLogger(__name__)
 
+# Last engine built: (mode, kraken_client, engine). Engines are stateless apart
+# from the DB/exchange they wrap, so callers share one instead of paying the
+# constructor (PAPER: bot-status DB round-trip) on every request.
+_cached_engine: Optional[Tuple[str, Optional[KrakenClient], TradingEngine]] = None
+
 def get_trading_engine(kraken_client: KrakenClient = None) -> TradingEngine:
     """Get appropriate trading engine based on MODE
     
@@ -20,14 +25,22 @@ def get_trading_engine(kraken_client: KrakenClient = None) -> TradingEngine:
         
     Returns:
         TradingEngine: Real or Paper engine based on configuration
+        (cached until MODE or the kraken_client instance changes)
     """
+    global _cached_engine
+    if _cached_engine and _cached_engine[0] == MODE and _cached_engine[1] is kraken_client:
+        return _cached_engine[2]
+
     if MODE == "REAL":
         if not kraken_client:
             raise ValueError("KrakenClient required for REAL mode")
         logger.info("Using REAL trading engine")
-        return RealTradingEngine(kraken_client)
+        engine = RealTradingEngine(kraken_client)
     elif MODE == "PAPER":
         logger.info("Using PAPER trading engine")
-        return PaperTradingEngine()
+        engine = PaperTradingEngine()
     else:
         raise ValueError(f"Unknown trading mode: {MODE}")
+
+    _cached_engine = (MODE, kraken_client, engine)
+    return engine
@@ -3,10 +3,13 @@ Paper trading mode - simulates trades with real market data
 """
 
 import logging
+import uuid
 import requests
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Dict, Tuple
 from .base import TradingEngine
+from ...database import SessionLocal
+from ...models import BotStatus, Trade
 
 logger = logging.getLogger(__name__)
 
@@ -20,10 +23,6 @@ class PaperTradingEngine(TradingEngine):
 
     def _init_bot_status(self):
         """Initialize or get bot status from database"""
-        from ...database import SessionLocal
-        from ...models import BotStatus
-        from datetime import datetime, timezone
-
         db = SessionLocal()
         try:
             status = db.query(BotStatus).filter(BotStatus.trading_mode == "PAPER").first()
@@ -53,9 +52,6 @@ class PaperTradingEngine(TradingEngine):
 
     def _get_status(self):
         """Get current bot status from database"""
-        from ...database import SessionLocal
-        from ...models import BotStatus
-
         db = SessionLocal()
         try:
             return db.query(BotStatus).filter(BotStatus.trading_mode == "PAPER").first()
@@ -64,9 +60,6 @@ class PaperTradingEngine(TradingEngine):
 
     def _update_status(self, **kwargs):
         """Update bot status in database"""
-        from ...database import SessionLocal
-        from ...models import BotStatus
-
         db = SessionLocal()
         try:
             status = db.query(BotStatus).filter(BotStatus.trading_mode == "PAPER").first()
@@ -80,15 +73,21 @@ class PaperTradingEngine(TradingEngine):
         finally:
             db.close()
 
-    def _save_trade(self, order_type: str, price: float, quantity: float,
-                     status_obj=None, ai_regime: str = None, entry_price: float = None):
-        """Save trade to database with shadow margin tracking"""
-        from ...database import SessionLocal
-        from ...models import Trade
-        import uuid
+    def _commit_trade(self, order_type: str, price: float, quantity: float,
+                      usd_delta: float, btc_delta: float, ai_regime: str = None,
+                      entry_price: float = None, **status_fields) -> bool:
+        """Apply wallet changes and save the trade in a single transaction
 
+        Balances are adjusted by deltas on the row loaded inside the transaction,
+        so a trade is never recorded without its wallet update (or vice versa).
+        """
         db = SessionLocal()
         try:
+            status = db.query(BotStatus).filter(BotStatus.trading_mode == "PAPER").first()
+            if not status:
+                self.logger.error("Error saving trade: bot status not found")
+                return False
+
             # Calculate shadow leverage (1.5x for BULL, 1.0x otherwise)
             shadow_leverage = 1.5 if ai_regime == 'BULL' else 1.0
 
@@ -102,7 +101,12 @@ class PaperTradingEngine(TradingEngine):
                 # Shadow margin profit (simulating leverage)
                 shadow_profit = real_profit * shadow_leverage
 
-            trade = Trade(
+            status.usd_balance += usd_delta
+            status.btc_balance += btc_delta
+            for key, value in status_fields.items():
+                setattr(status, key, value)
+
+            db.add(Trade(
                 trade_id=f"PAPER-{uuid.uuid4().hex[:8]}",
                 order_type=order_type,
                 symbol="BTCUSD",
@@ -118,17 +122,20 @@ class PaperTradingEngine(TradingEngine):
                 shadow_leverage=shadow_leverage,
                 real_profit_usd=real_profit,
                 shadow_profit_usd=shadow_profit
-            )
-            db.add(trade)
+            ))
             db.commit()
 
             if order_type == "SELL" and shadow_profit:
-                self.logger.info(f"Trade saved: {order_type} | Real: ${real_profit:.2f} | Shadow (x{shadow_leverage}): ${shadow_profit:.2f}")
+                self.logger.info("Trade saved: %s | Real: $%.2f | Shadow (x%s): $%.2f",
+                                 order_type, real_profit, shadow_leverage, shadow_profit)
             else:
-                self.logger.info(f"Trade saved: {order_type} {quantity:.8f} BTC at ${price:.2f} | Regime: {ai_regime}")
+                self.logger.info("Trade saved: %s %.8f BTC at $%.2f | Regime: %s",
+                                 order_type, quantity, price, ai_regime)
+            return True
         except Exception as e:
             self.logger.error(f"Error saving trade: {e}")
             db.rollback()
+            return False
         finally:
             db.close()
 
@@ -158,16 +165,17 @@ class PaperTradingEngine(TradingEngine):
         # Initialize trailing stop at 99% of entry price
         initial_stop = price * 0.99
 
-        # Update balances and set trailing stop
-        self._update_status(
-            usd_balance=status.usd_balance - usd_amount,
-            btc_balance=status.btc_balance + btc_quantity,
+        # Update balances, set trailing stop and save trade (with AI regime
+        # for shadow margin) atomically
+        if not self._commit_trade(
+            "BUY", price, btc_quantity,
+            usd_delta=-usd_amount,
+            btc_delta=btc_quantity,
+            ai_regime=ai_regime,
             last_buy_price=price,
             trailing_stop_price=initial_stop
-        )
-
-        # Save trade with AI regime for shadow margin
-        self._save_trade("BUY", price, btc_quantity, status, ai_regime=ai_regime)
+        ):
+            return False, "Error saving paper trade"
 
         shadow_lev = "x1.5" if ai_regime == 'BULL' else "x1.0"
         msg = f"📈 PAPER BUY: {btc_quantity:.8f} BTC at ${price:.2f} | Regime: {ai_regime} ({shadow_lev})"
@@ -190,16 +198,17 @@ class PaperTradingEngine(TradingEngine):
         # Calculate USD proceeds
         usd_proceeds = btc_amount * price
 
-        # Update balances
-        self._update_status(
-            usd_balance=status.usd_balance + usd_proceeds,
-            btc_balance=status.btc_balance - btc_amount,
+        # Update balances and save trade with shadow margin atomically
+        if not self._commit_trade(
+            "SELL", price, btc_amount,
+            usd_delta=usd_proceeds,
+            btc_delta=-btc_amount,
+            ai_regime=ai_regime,
+            entry_price=entry_price,
             last_buy_price=None,
             trailing_stop_price=None
-        )
-
-        # Save trade with shadow margin
-        self._save_trade("SELL", price, btc_amount, status, ai_regime=ai_regime, entry_price=entry_price)
+        ):
+            return False, "Error saving paper trade"
 
         # Calculate profits for logging
         if entry_price:
@@ -290,9 +299,6 @@ class PaperTradingEngine(TradingEngine):
 
     def reset_wallet(self, initial_usd: float = 1000.0):
         """Reset wallet to initial state"""
-        from ...database import SessionLocal
-        from ...models import BotStatus
-
         db = SessionLocal()
         try:
             status = db.query(BotStatus).filter(BotStatus.trading_mode == "PAPER").first()
@@ -5,9 +5,11 @@ With dynamic thresholds based on volatility to reduce overfitting
 
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Tuple
+from typing import List, Dict, Sequence, Tuple
 import logging
 
+from ._njit import njit, as_f64
+
 logger = logging.getLogger(__name__)
 
 # Market regime detection thresholds
@@ -15,6 +17,117 @@ VOLATILITY_LOW = 0.02  # < 2% daily volatility = calm market
 VOLATILITY_HIGH = 0.04  # > 4% daily volatility = volatile market
 
 
+# Numeric kernels (JIT-compiled when numba is available); inputs are
+# contiguous float64 arrays, see as_f64
+@njit(cache=True)
+def _ema(x, span):
+    """EMA series, same as pandas ewm(span=span, adjust=False).mean()"""
+    n = x.shape[0]
+    out = np.empty(n)
+    if n == 0:
+        return out
+    alpha = 2.0 / (span + 1.0)
+    e = x[0]
+    out[0] = e
+    for i in range(1, n):
+        e += alpha * (x[i] - e)
+        out[i] = e
+    return out
+
+
+@njit(cache=True)
+def _rsi_sma(x, period):
+    """
+    RSI series using simple rolling means of gains/losses.
+
+    Mirrors the pandas version: the first delta counts as 0 and the first
+    valid value is at index period - 1 (NaN before it).
+    """
+    n = x.shape[0]
+    out = np.full(n, np.nan)
+    gains = np.zeros(n)
+    losses = np.zeros(n)
+    for i in range(1, n):
+        d = x[i] - x[i - 1]
+        if d > 0:
+            gains[i] = d
+        elif d < 0:
+            losses[i] = -d
+
+    gain_sum = 0.0
+    loss_sum = 0.0
+    for i in range(n):
+        gain_sum += gains[i]
+        loss_sum += losses[i]
+        if i >= period:
+            gain_sum -= gains[i - period]
+            loss_sum -= losses[i - period]
+        if i >= period - 1:
+            if loss_sum > 0.0:
+                out[i] = 100.0 - 100.0 / (1.0 + gain_sum / loss_sum)
+            elif gain_sum > 0.0:
+                out[i] = 100.0
+    return out
+
+
+@njit(cache=True)
+def _rsi_sma_last(x, period):
+    """
+    Last value of _rsi_sma without the series: simple means of the last
+    `period` deltas (fewer if x is shorter), one pass, no temporaries.
+    Flat prices give 50.0.
+    """
+    n = x.shape[0]
+    gain = 0.0
+    loss = 0.0
+    for i in range(max(1, n - period), n):
+        d = x[i] - x[i - 1]
+        if d > 0:
+            gain += d
+        elif d < 0:
+            loss -= d
+    if loss > 0.0:
+        return 100.0 - 100.0 / (1.0 + gain / loss)
+    return 100.0 if gain > 0.0 else 50.0
+
+
+@njit(cache=True)
+def _bollinger(x, period, std_dev):
+    """Rolling mean +/- std_dev * sample std over period (NaN until the window fills)"""
+    n = x.shape[0]
+    upper = np.full(n, np.nan)
+    middle = np.full(n, np.nan)
+    lower = np.full(n, np.nan)
+    if period < 1:
+        return upper, middle, lower
+    for i in range(period - 1, n):
+        # Two-pass mean/variance per window: exact for large prices
+        mean = 0.0
+        for j in range(i - period + 1, i + 1):
+            mean += x[j]
+        mean /= period
+        var = 0.0
+        for j in range(i - period + 1, i + 1):
+            d = x[j] - mean
+            var += d * d
+        middle[i] = mean
+        if period == 1:
+            continue  # Sample std undefined for a single value (pandas: NaN)
+        band = std_dev * np.sqrt(var / (period - 1))
+        upper[i] = mean + band
+        lower[i] = mean - band
+    return upper, middle, lower
+
+
+def warm_up_kernels() -> None:
+    """Compile the JIT kernels with the argument types used at runtime (int periods, float std_dev)"""
+    sample = np.linspace(1.0, 2.0, 8)
+    _ema(sample, 3)
+    _rsi_sma(sample, 3)
+    _rsi_sma_last(sample, 3)
+    _bollinger(sample, 3, 2.0)
+
+
 class TechnicalIndicators:
     """Technical analysis indicators with adaptive thresholds"""
 
@@ -66,29 +179,25 @@ class TechnicalIndicators:
         return buy_threshold, sell_threshold
 
     @staticmethod
-    def calculate_ema(data: List[float], period: int) -> List[float]:
+    def calculate_ema(data: List[float], period: int) -> np.ndarray:
         """Calculate Exponential Moving Average"""
         if len(data) < period:
-            return []
+            return np.empty(0)
 
-        series = pd.Series(data)
-        ema = series.ewm(span=period, adjust=False).mean()
-        return ema.tolist()
+        return _ema(as_f64(data), period)
 
     @staticmethod
-    def calculate_rsi(data: List[float], period: int = 14) -> List[float]:
+    def calculate_rsi(data: List[float], period: int = 14) -> np.ndarray:
         """Calculate Relative Strength Index"""
         if len(data) < period + 1:
-            return []
+            return np.empty(0)
 
-        series = pd.Series(data)
-        delta = series.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
+        return _rsi_sma(as_f64(data), period)
 
-        rs = gain / loss
-        rsi = 100 - (100 / (1 + rs))
-        return rsi.tolist()
+    @staticmethod
+    def calculate_rsi_last(data: Sequence[float], period: int = 14) -> float:
+        """Latest calculate_rsi value in O(period), for callers that only need the current RSI"""
+        return float(_rsi_sma_last(as_f64(data), period))
 
     @staticmethod
     def calculate_macd(
@@ -96,37 +205,23 @@ class TechnicalIndicators:
         fast: int = 12,
         slow: int = 26,
         signal: int = 9
-    ) -> Tuple[List[float], List[float], List[float]]:
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """Calculate MACD indicator"""
-        series = pd.Series(data)
-        ema_fast = series.ewm(span=fast, adjust=False).mean()
-        ema_slow = series.ewm(span=slow, adjust=False).mean()
-
-        macd_line = ema_fast - ema_slow
-        signal_line = macd_line.ewm(span=signal, adjust=False).mean()
+        prices = as_f64(data)
+        macd_line = _ema(prices, fast) - _ema(prices, slow)
+        signal_line = _ema(macd_line, signal)
         histogram = macd_line - signal_line
 
-        return (
-            macd_line.tolist(),
-            signal_line.tolist(),
-            histogram.tolist()
-        )
+        return macd_line, signal_line, histogram
 
     @staticmethod
     def calculate_bollinger_bands(
         data: List[float],
         period: int = 20,
         std_dev: float = 2.0
-    ) -> Tuple[List[float], List[float], List[float]]:
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """Calculate Bollinger Bands"""
-        series = pd.Series(data)
-        middle = series.rolling(window=period).mean()
-        std = series.rolling(window=period).std()
-
-        upper = middle + (std_dev * std)
-        lower = middle - (std_dev * std)
-
-        return (upper.tolist(), middle.tolist(), lower.tolist())
+        return _bollinger(as_f64(data), period, float(std_dev))
 
     @staticmethod
     def calculate_score(
@@ -181,7 +276,7 @@ class TechnicalIndicators:
 
     @staticmethod
     def analyze_signals(
-        prices: List[float],
+        prices: Sequence[float],
         ema20_period: int = 20,
         ema50_period: int = 50,
         rsi_period: int = 14
@@ -191,6 +286,9 @@ class TechnicalIndicators:
             return {}
 
         try:
+            # One float64 conversion shared by every kernel below
+            prices = as_f64(prices)
+
             # Calculate basic indicators
             ema20 = TechnicalIndicators.calculate_ema(prices, ema20_period)
             ema50 = TechnicalIndicators.calculate_ema(prices, ema50_period)
@@ -200,15 +298,17 @@ class TechnicalIndicators:
             macd_line, macd_signal, macd_hist = TechnicalIndicators.calculate_macd(prices)
             bb_upper, bb_middle, bb_lower = TechnicalIndicators.calculate_bollinger_bands(prices)
 
-            current_price = prices[-1]
-            current_ema20 = ema20[-1] if ema20 else 0
-            current_ema50 = ema50[-1] if ema50 else 0
-            current_rsi = rsi[-1] if rsi else 0
-            current_macd = macd_line[-1] if macd_line else 0
-            current_macd_signal = macd_signal[-1] if macd_signal else 0
-            current_macd_hist = macd_hist[-1] if macd_hist else 0
-            current_bb_upper = bb_upper[-1] if bb_upper else current_price
-            current_bb_lower = bb_lower[-1] if bb_lower else current_price
+            # Only the latest values are needed; cast to plain floats so the
+            # result stays JSON-serializable
+            current_price = float(prices[-1])
+            current_ema20 = float(ema20[-1]) if ema20.size else 0
+            current_ema50 = float(ema50[-1]) if ema50.size else 0
+            current_rsi = float(rsi[-1]) if rsi.size else 0
+            current_macd = float(macd_line[-1]) if macd_line.size else 0
+            current_macd_signal = float(macd_signal[-1]) if macd_signal.size else 0
+            current_macd_hist = float(macd_hist[-1]) if macd_hist.size else 0
+            current_bb_upper = float(bb_upper[-1]) if bb_upper.size else current_price
+            current_bb_lower = float(bb_lower[-1]) if bb_lower.size else current_price
 
             # Calculate Bollinger position (0-1)
             bb_range = current_bb_upper - current_bb_lower
@@ -4,10 +4,13 @@ Telegram alerts system
 
 import requests
 import logging
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
+# Telegram rejects sendMessage text longer than this
+MAX_MESSAGE_LENGTH = 4096
+
 class TelegramAlerts:
     """Telegram bot for trading alerts"""
     
@@ -16,6 +19,8 @@ class TelegramAlerts:
         self.token = token
         self.chat_id = chat_id
         self.api_url = f"https://api.telegram.org/bot{token}/sendMessage"
+        # One keep-alive session: later alerts skip the TCP + TLS handshake
+        self.session = requests.Session()
         self.logger = logger
     
     def send_message(self, message: str) -> bool:
@@ -27,7 +32,7 @@ class TelegramAlerts:
                 'parse_mode': 'HTML'
             }
             
-            response = requests.post(self.api_url, json=payload, timeout=10)
+            response = self.session.post(self.api_url, json=payload, timeout=10)
             
             if response.status_code == 200:
                 self.logger.info("Telegram message sent successfully")
@@ -39,9 +44,31 @@ class TelegramAlerts:
             self.logger.error(f"Error sending Telegram message: {e}")
             return False
     
+    def send_batch(self, messages: List[str]) -> bool:
+        """Send several alerts as few messages as the length limit allows"""
+        sent = True
+        chunk = ""
+        for message in messages:
+            if chunk and len(chunk) + len(message) > MAX_MESSAGE_LENGTH:
+                sent = self.send_message(chunk) and sent
+                chunk = ""
+            chunk += message
+        if chunk:
+            sent = self.send_message(chunk) and sent
+        return sent
+    
+    def close(self):
+        """Close pooled connections (the session reconnects if used again)"""
+        self.session.close()
+    
     def send_buy_signal(self, price: float, quantity: float, confidence: float) -> bool:
         """Send buy signal alert"""
-        message = f"""
+        return self.send_message(self.buy_signal_message(price, quantity, confidence))
+    
+    @staticmethod
+    def buy_signal_message(price: float, quantity: float, confidence: float) -> str:
+        """Format buy signal alert"""
+        return f"""
 🟢 <b>BUY SIGNAL</b> 🟢
 
 💰 Entry Price: <code>${price:,.2f}</code>
@@ -50,7 +77,6 @@ class TelegramAlerts:
 
 <i>Order placed on Kraken</i>
 """
-        return self.send_message(message)
     
     def send_sell_signal(
         self, 
@@ -60,9 +86,21 @@ class TelegramAlerts:
         trigger: str = 'AI_SIGNAL'
     ) -> bool:
         """Send sell signal alert"""
+        return self.send_message(
+            self.sell_signal_message(entry_price, exit_price, profit_loss, trigger)
+        )
+    
+    @staticmethod
+    def sell_signal_message(
+        entry_price: float, 
+        exit_price: float, 
+        profit_loss: float,
+        trigger: str = 'AI_SIGNAL'
+    ) -> str:
+        """Format sell signal alert"""
         pnl_emoji = '📈' if profit_loss > 0 else '📉'
         
-        message = f"""
+        return f"""
 🔴 <b>SELL SIGNAL</b> 🔴
 
 📍 Entry Price: <code>${entry_price:,.2f}</code>
@@ -73,7 +111,6 @@ class TelegramAlerts:
 
 <i>Order executed on Kraken</i>
 """
-        return self.send_message(message)
     
     def send_trailing_stop_update(self, current_price: float, trailing_stop: float) -> bool:
         """Send trailing stop update"""
@@ -114,9 +151,14 @@ class TelegramAlerts:
     
     def send_error_alert(self, error_message: str, severity: str = 'HIGH') -> bool:
         """Send error alert"""
+        return self.send_message(self.error_alert_message(error_message, severity))
+    
+    @staticmethod
+    def error_alert_message(error_message: str, severity: str = 'HIGH') -> str:
+        """Format error alert"""
         severity_emoji = '🔴' if severity == 'HIGH' else '🟡' if severity == 'MEDIUM' else '⚪'
         
-        message = f"""
+        return f"""
 {severity_emoji} <b>BOT ERROR ALERT</b> {severity_emoji}
 
 <b>Severity:</b> <code>{severity}</code>
@@ -126,4 +168,3 @@ class TelegramAlerts:
 
 <i>Please check bot status immediately</i>
 """
-        return self.send_message(message)
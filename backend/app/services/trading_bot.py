@@ -17,15 +17,25 @@ Uses CCXT for Kraken API (portability).
 
 import logging
 import asyncio
-from typing import Dict, Optional, Tuple
+import queue
+import sys
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Sequence, Tuple
 from datetime import datetime
 from enum import Enum
 
 import ccxt
-import pandas as pd
 import numpy as np
 
-import time
+from ..config import Config
+from ..database import SessionLocal
+from ..models import BotStatus, Trade, TradingCycle
+from ._njit import njit, as_f32, as_f64
+from .ai_regime import AIRegimeService
+from .telegram_alerts import TelegramAlerts
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +48,11 @@ BULL_SHADOW_LEVERAGE = 1.5      # Shadow leverage for BULL regime audit
 SPOT_LEVERAGE = 1.0             # Real execution is always spot
 RSI_WINTER_THRESHOLD = 65       # RSI minimum for winter buys
 RSI_PERIOD = 14                 # RSI period (standard)
+CATASTROPHIC_FACTOR = 0.97      # BULL exits only below EMA50 * this (3% drop)
+
+# Threshold multipliers, folded once (level * factor instead of level * (1 ± buffer))
+_ENTRY_FACTOR = 1 + BUFFER_PERCENT
+_EXIT_FACTOR = 1 - BUFFER_PERCENT
 
 # Standard EMA periods on DAILY candles (exact backtest configuration)
 EMA_FAST = 20                   # EMA20 Daily
@@ -46,6 +61,130 @@ EMA_SLOW = 200                  # EMA200 Daily (Winter Protocol)
 
 OHLC_LIMIT = 720                # Daily candles (720 days = ~2 years history)
 OHLC_TIMEFRAME = '1d'           # DAILY candles for indicators
+OHLC_CACHE_TTL = 15 * 60        # Reuse fetched daily candles for 15 min (seconds)
+BTC_DUST = 0.0001               # BTC balances at or below this are not a position
+MIN_ORDER_USD = 10              # Smallest buy the bot will place (USD)
+CYCLE_WRITE_BATCH = 100         # Max TradingCycle rows per write-behind commit
+ALERT_BATCH = 10                # Max alerts coalesced into one Telegram send
+ALERT_COALESCE_WINDOW = 0.5     # Seconds to wait for more alerts before sending
+
+# TradingCycle column <- (analysis key, default) mapping used by _save_cycle_to_db
+_CYCLE_FIELDS = (
+    ('btc_price', 'price', 0),
+    ('ema20', 'ema20', 0),
+    ('ema50', 'ema50', 0),
+    ('rsi14', 'rsi', 0),
+    ('ema200', 'ema200', 0),
+    ('btc_balance', 'btc_balance', 0),
+    ('usd_balance', 'usd_balance', 0),
+    ('ai_signal', 'signal', 'HOLD'),
+    ('ai_confidence', 'confidence', 0),
+    ('ai_regime', 'regime', 'LATERAL'),
+    ('leverage_multiplier', 'shadow_leverage', 1.0),
+    ('is_winter_mode', 'is_winter_mode', False),
+    ('action', 'action', 'HOLD'),
+    ('trade_id', 'trade_id', None),
+    ('error_message', 'error', None),
+)
+
+# Compiled once; Core executemany skips the ORM unit-of-work for cycle rows
+_CYCLE_INSERT = TradingCycle.__table__.insert()
+
+# Cycle banner rule; each banner line stays its own record so the dashboard
+# log view keeps showing one entry per line
+_RULE = "=" * 60
+
+# Last (epoch second, ISO string) handed out by _now_iso
+_last_iso: Tuple[int, str] = (0, "")
+
+
+def _build_cycle_row(analysis: Dict, trading_mode: str, execution_time_ms: int, trigger: str) -> Dict:
+    """TradingCycle row dict for a cycle's analysis (missing keys get the column defaults)"""
+    get = analysis.get
+    reason = get('reason', '')
+    regime_reasoning = get('regime_reasoning', '')
+    return {
+        **{column: get(key, default) for column, key, default in _CYCLE_FIELDS},
+        # Enhanced reason with the AI regime reasoning
+        'ai_reason': f"{reason} | AI: {regime_reasoning[:100]}" if regime_reasoning else reason,
+        'execution_time_ms': execution_time_ms,
+        'trading_mode': trading_mode,
+        'trigger': trigger,
+    }
+
+
+def _now_iso() -> str:
+    """Local-time ISO timestamp at 1 s resolution, formatted at most once per second"""
+    global _last_iso
+    now = int(time.time())
+    if now != _last_iso[0]:
+        _last_iso = (now, datetime.fromtimestamp(now).isoformat())
+    return _last_iso[1]
+
+
+# ============================================================================
+# NUMERIC KERNELS (JIT-compiled when numba is available)
+# ============================================================================
+@njit(cache=True)
+def _rsi_value(gain, loss):
+    """RSI from Wilder's average gain/loss (50.0 when the market did not move)"""
+    if loss == 0.0:
+        return 100.0 if gain > 0.0 else 50.0
+    return 100.0 - 100.0 / (1.0 + gain / loss)
+
+
+@njit(cache=True, fastmath=True, boundscheck=False)
+def _daily_levels(x, period):
+    """
+    EMA20/50/200 and Wilder's average gain/loss over x in one fused pass.
+
+    EMAs match pandas ewm(span, adjust=False): seeded with the first price,
+    then e = e + alpha * (p - e). Wilder's averages are seeded with the SMA of
+    the first `period` deltas, then avg = avg * (period - 1) / period + new / period.
+    Each price is loaded once for all five updates. Expects a contiguous,
+    non-empty float32 or float64 array (see as_f32); accumulates in float64.
+    Average gain/loss are 0.0 when there are not more than `period` prices
+    (RSI 50, neutral).
+    """
+    a20 = 2.0 / (EMA_FAST + 1.0)
+    a50 = 2.0 / (EMA_MEDIUM + 1.0)
+    a200 = 2.0 / (EMA_SLOW + 1.0)
+    inv = 1.0 / period
+    decay = (period - 1) * inv
+
+    e20 = np.float64(x[0])
+    e50 = e20
+    e200 = e20
+    gain = np.float64(0.0)
+    loss = np.float64(0.0)
+    for i in range(1, x.shape[0]):
+        p = x[i]
+        e20 += a20 * (p - e20)
+        e50 += a50 * (p - e50)
+        e200 += a200 * (p - e200)
+        d = p - x[i - 1]
+        if i <= period:
+            # Seed: SMA of the first `period` deltas
+            gain += max(d, 0.0)
+            loss += max(-d, 0.0)
+            if i == period:
+                gain *= inv
+                loss *= inv
+        else:
+            gain = gain * decay + max(d, 0.0) * inv
+            loss = loss * decay + max(-d, 0.0) * inv
+
+    if x.shape[0] <= period:
+        gain = 0.0
+        loss = 0.0
+    return e20, e50, e200, gain, loss
+
+
+def warm_up_kernels() -> None:
+    """Compile the JIT kernels on a tiny array so the first cycle doesn't pay for it"""
+    sample = np.linspace(1.0, 2.0, RSI_PERIOD + 2, dtype=np.float32)
+    _daily_levels(sample, RSI_PERIOD)
+    _daily_levels(sample.astype(np.float64), RSI_PERIOD)
 
 
 class TradingSignal(str, Enum):
@@ -55,6 +194,12 @@ class TradingSignal(str, Enum):
     HOLD = "HOLD"
 
 
+# Plain-str signal values for the per-cycle path (skip Enum attribute lookups)
+_BUY = TradingSignal.BUY.value
+_SELL = TradingSignal.SELL.value
+_HOLD = TradingSignal.HOLD.value
+
+
 class MarketRegime(str, Enum):
     """AI Market regime classification"""
     BULL = "BULL"
@@ -63,6 +208,11 @@ class MarketRegime(str, Enum):
     VOLATILE = "VOLATILE"
 
 
+# Plain-str regime values for the per-cycle path (same idea as _BUY/_SELL/_HOLD)
+_BULL = MarketRegime.BULL.value
+_LATERAL = MarketRegime.LATERAL.value
+
+
 # ============================================================================
 # CORE STRATEGY ENGINE
 # ============================================================================
@@ -73,7 +223,7 @@ class StrategyEngine:
     """
 
     @staticmethod
-    def calculate_indicators(closes: pd.Series) -> Dict[str, float]:
+    def calculate_indicators(closes: Sequence[float]) -> Dict[str, float]:
         """
         Calculate all required technical indicators on DAILY data.
 
@@ -82,33 +232,32 @@ class StrategyEngine:
         - Standard periods: EMA20, EMA50, EMA200, RSI14
 
         Args:
-            closes: Series of DAILY closing prices (need 200+ for EMA200)
+            closes: DAILY closing prices, oldest first (need 200+ for EMA200);
+                any sequence, ndarray or pandas Series
 
         Returns:
             Dict with ema20, ema50, ema200, rsi14
         """
-        if len(closes) < EMA_SLOW:
-            logger.warning(f"Insufficient data for EMA{EMA_SLOW}: {len(closes)} candles (need {EMA_SLOW}+)")
-
-        # Standard EMAs on daily data
-        ema20 = closes.ewm(span=EMA_FAST, adjust=False).mean().iloc[-1]
-        ema50 = closes.ewm(span=EMA_MEDIUM, adjust=False).mean().iloc[-1]
-        ema200 = closes.ewm(span=EMA_SLOW, adjust=False).mean().iloc[-1] if len(closes) >= EMA_SLOW else closes.mean()
-
-        # RSI calculation (standard 14 period)
-        delta = closes.diff()
-        gain = delta.where(delta > 0, 0).rolling(window=RSI_PERIOD).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=RSI_PERIOD).mean()
-        rs = gain / loss
-        rsi_series = 100 - (100 / (1 + rs))
-        rsi14 = rsi_series.iloc[-1] if not pd.isna(rsi_series.iloc[-1]) else 50.0
+        values = as_f64(closes)
+        n = len(values)
+        if n < EMA_SLOW:
+            logger.warning(f"Insufficient data for EMA{EMA_SLOW}: {n} candles (need {EMA_SLOW}+)")
+
+        # Prices as float32 halve the memory the kernel streams through; its
+        # accumulators stay float64. float32 keeps ~7 significant digits, so a
+        # close like 104532.17 rounds to ~0.01 USD: results stay within 1e-4
+        # (relative for EMAs, absolute for RSI) of the float64 values.
+        # One fused pass gives the three EMAs and Wilder's RSI averages (14 period)
+        ema20, ema50, ema200, gain, loss = _daily_levels(as_f32(values), RSI_PERIOD)
+        if n < EMA_SLOW:
+            ema200 = values.mean()
 
         return {
             'ema20': float(ema20),
             'ema50': float(ema50),
             'ema200': float(ema200),
-            'rsi14': float(rsi14),
-            'close': float(closes.iloc[-1])
+            'rsi14': float(_rsi_value(gain, loss)),
+            'close': float(values[-1])
         }
 
     @staticmethod
@@ -161,32 +310,29 @@ class StrategyEngine:
 
         # Winter Protocol
         if is_winter:
-            if regime != MarketRegime.BULL.value:
+            if regime != _BULL:
                 return False, f"Winter Mode ON | Regime: {regime} | BLOCKED (Only BULL allowed)"
             if rsi < RSI_WINTER_THRESHOLD:
                 return False, f"Winter Mode ON | Regime: BULL | RSI: {rsi:.0f} | BLOCKED (RSI < {RSI_WINTER_THRESHOLD})"
             # Winter entry allowed
-            entry_threshold = ema20 * (1 + BUFFER_PERCENT)
+            entry_threshold = ema20 * _ENTRY_FACTOR
             if close > entry_threshold:
                 return True, f"Winter Mode ON | Regime: BULL | RSI: {rsi:.0f} >= {RSI_WINTER_THRESHOLD} | ENTRY ALLOWED"
             return False, f"Winter Mode ON | Price ${close:,.0f} < Entry ${entry_threshold:,.0f}"
 
         # Normal market (not winter)
-        if regime == MarketRegime.BULL.value:
-            entry_threshold = ema20 * (1 + BUFFER_PERCENT)
-            if close > entry_threshold:
-                return True, f"Normal Mode | Regime: BULL | Price ${close:,.0f} > EMA20+1.5% ${entry_threshold:,.0f}"
-            return False, f"Normal Mode | Regime: BULL | Price ${close:,.0f} < EMA20+1.5% ${entry_threshold:,.0f}"
-
-        elif regime == MarketRegime.LATERAL.value:
-            entry_threshold = ema50 * (1 + BUFFER_PERCENT)
-            if close > entry_threshold:
-                return True, f"Normal Mode | Regime: LATERAL | Price ${close:,.0f} > EMA50+1.5% ${entry_threshold:,.0f}"
-            return False, f"Normal Mode | Regime: LATERAL | Price ${close:,.0f} < EMA50+1.5% ${entry_threshold:,.0f}"
-
+        if regime == _BULL:
+            label, level = "EMA20", ema20
+        elif regime == _LATERAL:
+            label, level = "EMA50", ema50
         else:  # BEAR, VOLATILE, or unknown
             return False, f"Normal Mode | Regime: {regime} | BLOCKED (No entries in BEAR/VOLATILE)"
 
+        entry_threshold = level * _ENTRY_FACTOR
+        if close > entry_threshold:
+            return True, f"Normal Mode | Regime: {regime} | Price ${close:,.0f} > {label}+1.5% ${entry_threshold:,.0f}"
+        return False, f"Normal Mode | Regime: {regime} | Price ${close:,.0f} < {label}+1.5% ${entry_threshold:,.0f}"
+
     @staticmethod
     def should_exit(
         close: float,
@@ -208,13 +354,13 @@ class StrategyEngine:
         if not has_position:
             return False, "No position to exit"
 
-        exit_threshold = ema50 * (1 - BUFFER_PERCENT)
+        exit_threshold = ema50 * _EXIT_FACTOR
 
         if close < exit_threshold:
             # In BULL, we might want to hold tighter, but still exit on break
-            if regime == MarketRegime.BULL.value:
+            if regime == _BULL:
                 # Give a bit more room in BULL - check if drop is significant
-                catastrophic_threshold = ema50 * 0.97  # 3% below EMA50
+                catastrophic_threshold = ema50 * CATASTROPHIC_FACTOR  # 3% below EMA50
                 if close < catastrophic_threshold:
                     return True, f"BULL Regime | CATASTROPHIC DROP | Price ${close:,.0f} < EMA50-3% ${catastrophic_threshold:,.0f}"
                 return False, f"BULL Regime | Price ${close:,.0f} < EMA50-1.5% but HOLDING (not catastrophic)"
@@ -225,33 +371,35 @@ class StrategyEngine:
 
     @staticmethod
     def get_trading_signal(
-        closes: list,
+        closes: Sequence[float],
         regime: str,
         has_position: bool,
-        current_price: Optional[float] = None
+        current_price: Optional[float] = None,
+        indicators: Optional[Dict[str, float]] = None
     ) -> Dict:
         """
         Main decision function - returns complete trading signal.
 
         Args:
-            closes: List of closing prices (need 1000+ for accurate EMA200)
+            closes: List or float64 array of closing prices (need 1000+ for accurate EMA200)
             regime: Current AI regime (BULL, BEAR, LATERAL, VOLATILE)
             has_position: Whether we currently hold BTC
             current_price: Override price (uses last close if not provided)
+            indicators: Precomputed calculate_indicators(closes) result, if any
 
         Returns:
             Dict with signal, reason, indicators, shadow_leverage, etc.
         """
         if len(closes) < 50:
             return {
-                'signal': TradingSignal.HOLD.value,
+                'signal': _HOLD,
                 'reason': f"Insufficient data: {len(closes)} candles (need 50+)",
                 'shadow_leverage': SPOT_LEVERAGE,
                 'is_winter_mode': False
             }
 
-        series = pd.Series(closes)
-        indicators = StrategyEngine.calculate_indicators(series)
+        if indicators is None:
+            indicators = StrategyEngine.calculate_indicators(closes)
 
         close = current_price if current_price else indicators['close']
         ema20 = indicators['ema20']
@@ -265,12 +413,12 @@ class StrategyEngine:
         # Determine signal
         if has_position:
             should_sell, reason = StrategyEngine.should_exit(close, ema50, regime, has_position)
-            signal = TradingSignal.SELL.value if should_sell else TradingSignal.HOLD.value
+            signal = _SELL if should_sell else _HOLD
         else:
             should_buy, reason = StrategyEngine.should_enter(
                 close, ema20, ema50, ema200, rsi, regime, has_position
             )
-            signal = TradingSignal.BUY.value if should_buy else TradingSignal.HOLD.value
+            signal = _BUY if should_buy else _HOLD
 
         return {
             'signal': signal,
@@ -283,10 +431,92 @@ class StrategyEngine:
             'ema50': ema50,
             'ema200': ema200,
             'rsi': rsi,
-            'entry_threshold_bull': ema20 * (1 + BUFFER_PERCENT),
-            'entry_threshold_lateral': ema50 * (1 + BUFFER_PERCENT),
-            'exit_threshold': ema50 * (1 - BUFFER_PERCENT),
-            'timestamp': datetime.now().isoformat()
+            'entry_threshold_bull': ema20 * _ENTRY_FACTOR,
+            'entry_threshold_lateral': ema50 * _ENTRY_FACTOR,
+            'exit_threshold': ema50 * _EXIT_FACTOR,
+            'timestamp': _now_iso()
+        }
+
+
+# ============================================================================
+# INCREMENTAL DAILY INDICATORS
+# ============================================================================
+class IndicatorState:
+    """
+    Running EMA20/50/200 and Wilder RSI averages over CLOSED daily candles.
+
+    Built once with a full kernel pass, then advanced by the one or two
+    candles that close between cycles. The still-open candle is never folded
+    in: snapshot() applies it as one extra step without mutating the state.
+    """
+
+    __slots__ = ('last_ts', 'last_close', 'ema20', 'ema50', 'ema200', 'avg_gain', 'avg_loss')
+
+    _ALPHAS = tuple(2.0 / (span + 1.0) for span in (EMA_FAST, EMA_MEDIUM, EMA_SLOW))
+    _RSI_INV = 1.0 / RSI_PERIOD
+
+    def __init__(self, last_ts, last_close: float, ema20: float, ema50: float,
+                 ema200: float, avg_gain: float, avg_loss: float):
+        self.last_ts = last_ts
+        self.last_close = last_close
+        self.ema20 = ema20
+        self.ema50 = ema50
+        self.ema200 = ema200
+        self.avg_gain = avg_gain
+        self.avg_loss = avg_loss
+
+    @classmethod
+    def from_closes(cls, last_ts, closes: np.ndarray) -> 'IndicatorState':
+        """Cold start: full pass over closed candles (needs more than RSI_PERIOD)
+
+        float64 like advance()/snapshot(), so a rebuilt state matches the
+        incrementally advanced one.
+        """
+        ema20, ema50, ema200, avg_gain, avg_loss = _daily_levels(as_f64(closes), RSI_PERIOD)
+        return cls(
+            last_ts, float(closes[-1]),
+            float(ema20), float(ema50), float(ema200),
+            float(avg_gain), float(avg_loss)
+        )
+
+    @staticmethod
+    def _step(values: Tuple[float, ...], prev_close: float, price: float) -> Tuple[float, ...]:
+        """One candle of EMA and Wilder updates (same arithmetic as the kernels)"""
+        ema20, ema50, ema200, gain, loss = values
+        a20, a50, a200 = IndicatorState._ALPHAS
+        inv = IndicatorState._RSI_INV
+        decay = (RSI_PERIOD - 1) * inv
+        d = price - prev_close
+        return (
+            ema20 + a20 * (price - ema20),
+            ema50 + a50 * (price - ema50),
+            ema200 + a200 * (price - ema200),
+            gain * decay + max(d, 0.0) * inv,
+            loss * decay + max(-d, 0.0) * inv,
+        )
+
+    def _values(self) -> Tuple[float, ...]:
+        return (self.ema20, self.ema50, self.ema200, self.avg_gain, self.avg_loss)
+
+    def advance(self, last_ts, closes: Sequence[float]) -> None:
+        """Fold newly closed candles into the running values"""
+        values, prev = self._values(), self.last_close
+        for price in closes:
+            price = float(price)
+            values, prev = self._step(values, prev, price), price
+        self.ema20, self.ema50, self.ema200, self.avg_gain, self.avg_loss = values
+        self.last_ts, self.last_close = last_ts, prev
+
+    def snapshot(self, live_close: float) -> Dict[str, float]:
+        """Indicators including the open candle, in calculate_indicators' format"""
+        live_close = float(live_close)
+        ema20, ema50, ema200, gain, loss = self._step(self._values(), self.last_close, live_close)
+        return {
+            'ema20': ema20,
+            'ema50': ema50,
+            'ema200': ema200,
+            'rsi14': float(_rsi_value(gain, loss)),
+            'close': live_close
         }
 
 
@@ -297,24 +527,32 @@ class CCXTKrakenClient:
     """
     CCXT-based Kraken client for portability.
     Supports both public and authenticated API calls.
+
+    analyze_market fetches candles, ticker and balance from worker threads at
+    the same time. A sync ccxt exchange (its requests.Session, its nonce) is
+    not thread-safe, so public market data and private account calls use
+    separate exchange instances, each used by one thread at a time.
     """
 
     def __init__(self, api_key: str = "", api_secret: str = ""):
         """Initialize CCXT Kraken client"""
+        options = {'defaultType': 'spot'}
         self.exchange = ccxt.kraken({
             'apiKey': api_key,
             'secret': api_secret,
             'enableRateLimit': True,
-            'options': {
-                'defaultType': 'spot'
-            }
+            'options': options
         })
+        self.public = ccxt.kraken({'enableRateLimit': True, 'options': dict(options)})
+        self._public_lock = threading.Lock()
+        self._private_lock = threading.Lock()
         self.logger = logger
 
     def get_ticker(self, symbol: str = "BTC/USD") -> Dict:
         """Get current ticker data"""
         try:
-            ticker = self.exchange.fetch_ticker(symbol)
+            with self._public_lock:
+                ticker = self.public.fetch_ticker(symbol)
             return {
                 'symbol': symbol,
                 'last': ticker['last'],
@@ -331,7 +569,8 @@ class CCXTKrakenClient:
         self,
         symbol: str = "BTC/USD",
         timeframe: str = OHLC_TIMEFRAME,
-        limit: int = OHLC_LIMIT
+        limit: int = OHLC_LIMIT,
+        since: Optional[int] = None
     ) -> list:
         """
         Get OHLCV DAILY data for indicator calculation.
@@ -345,13 +584,15 @@ class CCXTKrakenClient:
             symbol: Trading pair (BTC/USD)
             timeframe: Candle timeframe (default: 1d for daily)
             limit: Number of candles (720 max, enough for EMA200)
+            since: Only candles from this timestamp (ms) on, for delta pulls
 
         Returns:
             List of [timestamp, open, high, low, close, volume]
         """
         try:
-            ohlcv = self.exchange.fetch_ohlcv(symbol, timeframe, limit=limit)
-            self.logger.info(f"Fetched {len(ohlcv)} DAILY candles for {symbol}")
+            with self._public_lock:
+                ohlcv = self.public.fetch_ohlcv(symbol, timeframe, since=since, limit=limit)
+            self.logger.info("Fetched %d DAILY candles for %s", len(ohlcv), symbol)
             return ohlcv
         except Exception as e:
             self.logger.error(f"Error fetching OHLCV: {e}")
@@ -360,7 +601,8 @@ class CCXTKrakenClient:
     def get_balance(self) -> Dict[str, float]:
         """Get account balances (requires authentication)"""
         try:
-            balance = self.exchange.fetch_balance()
+            with self._private_lock:
+                balance = self.exchange.fetch_balance()
             return {
                 'btc': float(balance.get('BTC', {}).get('free', 0)),
                 'usd': float(balance.get('USD', {}).get('free', 0)),
@@ -384,8 +626,9 @@ class CCXTKrakenClient:
             Order result dict
         """
         try:
-            order = self.exchange.create_market_order(symbol, side, amount)
-            self.logger.info(f"Market order executed: {side.upper()} {amount} {symbol}")
+            with self._private_lock:
+                order = self.exchange.create_market_order(symbol, side, amount)
+            self.logger.info("Market order executed: %s %s %s", side.upper(), amount, symbol)
             return {
                 'success': True,
                 'order_id': order['id'],
@@ -402,12 +645,51 @@ class CCXTKrakenClient:
 # ============================================================================
 # TRADING BOT ORCHESTRATOR
 # ============================================================================
+@dataclass(frozen=True, slots=True)
+class BotConfig:
+    """Immutable TradingBot settings (see TradingBot.__init__ for the fields)"""
+    kraken_api_key: str = field(default="", repr=False)
+    kraken_secret: str = field(default="", repr=False)
+    openai_api_key: str = field(default="", repr=False)
+    telegram_token: str = field(default="", repr=False)
+    telegram_chat_id: str = ""
+    trade_amount: float = 100.0  # Legacy (ignored)
+    trade_amount_percent: float = 75.0
+    min_balance: float = 50.0  # Legacy (ignored)
+    min_balance_percent: float = 20.0
+    trailing_stop_pct: float = 0.0  # Legacy (ignored, we use EMA50)
+    dry_run: bool = False
+
+
+@dataclass(slots=True)
+class ActiveTrade:
+    """Position opened by execute_buy (cleared on sell)"""
+    entry_price: float
+    quantity: float
+    order_id: str
+    regime: str
+    shadow_leverage: float
+    timestamp: str
+
+
 class TradingBot:
     """
     Main trading bot orchestrator.
     Executes strategy, manages positions, tracks shadow margin.
     """
 
+    __slots__ = (
+        'cfg', 'client', 'telegram', 'is_running', 'active_position', 'logger',
+        '_ohlcv_cache', '_ohlcv_lock',
+        '_indicator_memo', '_indicator_state',
+        '_cycle_queue', '_cycle_writer', '_cycle_writer_lock',
+        '_alert_queue', '_alert_sender', '_alert_sender_lock'
+    )
+
+    # Shared by every instance: the scheduler and the API router each build
+    # their own TradingBot, and cycles run in different event loops/threads
+    _cycle_lock = threading.Lock()
+
     def __init__(
         self,
         kraken_api_key: str = "",
@@ -438,62 +720,90 @@ class TradingBot:
             trailing_stop_pct: (Legacy) Trailing stop % - ignored, uses EMA50
             dry_run: If True, simulate orders without execution
         """
+        self.cfg = BotConfig(
+            kraken_api_key=kraken_api_key,
+            kraken_secret=kraken_secret,
+            openai_api_key=openai_api_key,
+            telegram_token=telegram_token,
+            telegram_chat_id=telegram_chat_id,
+            trade_amount=trade_amount,
+            trade_amount_percent=trade_amount_percent,
+            min_balance=min_balance,
+            min_balance_percent=min_balance_percent,
+            trailing_stop_pct=trailing_stop_pct,
+            dry_run=dry_run
+        )
         self.client = CCXTKrakenClient(kraken_api_key, kraken_secret)
-        self.openai_api_key = openai_api_key
-        self.telegram_token = telegram_token
-        self.telegram_chat_id = telegram_chat_id
-        self.trade_amount_percent = trade_amount_percent
-        self.min_balance_percent = min_balance_percent
-        self.dry_run = dry_run
 
         self.is_running = False
-        self.active_position: Optional[Dict] = None
+        self.active_position: Optional[ActiveTrade] = None
         self.logger = logger
 
+        # Daily candles barely move between cycles: cache them per
+        # (symbol, timeframe, limit) so back-to-back manual/scheduled cycles
+        # skip the Kraken round-trip. threading.Lock because scheduled cycles
+        # run in their own event loop (see scheduler.py).
+        self._ohlcv_cache: Dict[tuple, Tuple[float, list]] = {}
+        self._ohlcv_lock = threading.Lock()
+
+        # Daily indicators for the last candle set seen, keyed by
+        # (last candle open time, last close, candle count): while the candle
+        # is unchanged, repeated cycles skip the EMA/RSI pass
+        self._indicator_memo: Optional[Tuple[tuple, Dict[str, float]]] = None
+        # Running EMA/RSI state over closed candles, advanced by the candles
+        # that closed since the previous cycle instead of a 720-candle pass
+        self._indicator_state: Optional[IndicatorState] = None
+
+        # Write-behind queue for TradingCycle rows, drained in batches by a
+        # daemon thread started on first use (None is the stop sentinel)
+        self._cycle_queue: queue.Queue = queue.Queue()
+        self._cycle_writer: Optional[threading.Thread] = None
+        self._cycle_writer_lock = threading.Lock()
+
+        # Telegram alerts are queued for one daemon sender thread (started on
+        # first use, None is the stop sentinel) so an HTTPS round-trip never
+        # delays a trade and bursts go out as a single message
+        self._alert_queue: queue.Queue = queue.Queue()
+        self._alert_sender: Optional[threading.Thread] = None
+        self._alert_sender_lock = threading.Lock()
+
         # Initialize Telegram if configured
         self.telegram = None
         if telegram_token and telegram_chat_id:
             try:
-                from .telegram_alerts import TelegramAlerts
                 self.telegram = TelegramAlerts(telegram_token, telegram_chat_id)
             except Exception as e:
                 self.logger.warning(f"Telegram init failed: {e}")
 
         # Initialize paper wallet if dry_run
-        if self.dry_run:
+        if dry_run:
             self._init_paper_wallet()
 
     def _init_paper_wallet(self):
         """Initialize paper wallet in database if not exists"""
         try:
-            from ..database import SessionLocal
-            from ..models import BotStatus
-            db = SessionLocal()
-            status = db.query(BotStatus).filter(BotStatus.trading_mode == "PAPER").first()
-            if not status:
-                status = BotStatus(
-                    is_running=True,
-                    trading_mode="PAPER",
-                    btc_balance=0.0,
-                    usd_balance=1000.0,
-                    last_buy_price=None,
-                    trailing_stop_price=None
-                )
-                db.add(status)
-                db.commit()
-                self.logger.info("Created PAPER wallet with $1000 USD")
-            db.close()
+            with SessionLocal() as db:
+                status = db.query(BotStatus).filter(BotStatus.trading_mode == "PAPER").first()
+                if not status:
+                    status = BotStatus(
+                        is_running=True,
+                        trading_mode="PAPER",
+                        btc_balance=0.0,
+                        usd_balance=1000.0,
+                        last_buy_price=None,
+                        trailing_stop_price=None
+                    )
+                    db.add(status)
+                    db.commit()
+                    self.logger.info("Created PAPER wallet with $1000 USD")
         except Exception as e:
             self.logger.warning(f"Paper wallet init failed: {e}")
 
     def _get_paper_balance(self) -> Dict[str, float]:
         """Get balance from paper wallet in database"""
         try:
-            from ..database import SessionLocal
-            from ..models import BotStatus
-            db = SessionLocal()
-            status = db.query(BotStatus).filter(BotStatus.trading_mode == "PAPER").first()
-            db.close()
+            with SessionLocal() as db:
+                status = db.query(BotStatus).filter(BotStatus.trading_mode == "PAPER").first()
             if status:
                 return {'btc': status.btc_balance or 0, 'usd': status.usd_balance or 0}
             return {'btc': 0, 'usd': 1000}
@@ -504,45 +814,151 @@ class TradingBot:
     def _update_paper_balance(self, btc: float = None, usd: float = None):
         """Update paper wallet balance in database"""
         try:
-            from ..database import SessionLocal
-            from ..models import BotStatus
-            db = SessionLocal()
-            status = db.query(BotStatus).filter(BotStatus.trading_mode == "PAPER").first()
-            if status:
-                if btc is not None:
-                    status.btc_balance = btc
-                if usd is not None:
-                    status.usd_balance = usd
-                db.commit()
-            db.close()
+            with SessionLocal() as db:
+                status = db.query(BotStatus).filter(BotStatus.trading_mode == "PAPER").first()
+                if status:
+                    if btc is not None:
+                        status.btc_balance = btc
+                    if usd is not None:
+                        status.usd_balance = usd
+                    db.commit()
         except Exception as e:
             self.logger.warning(f"Paper balance update failed: {e}")
 
     def _get_balance(self) -> Dict[str, float]:
         """Get balance - paper wallet if dry_run, else real Kraken"""
-        if self.dry_run:
+        if self.cfg.dry_run:
             return self._get_paper_balance()
         return self.client.get_balance()
 
-    def _get_ai_regime(self) -> Dict:
-        """Get current AI regime from database or service"""
+    def _trade_amount_usd(self, usd_balance: float) -> float:
+        """Trade % of capital, capped so the reserve % stays"""
+        return usd_balance * min(
+            self.cfg.trade_amount_percent, 100 - self.cfg.min_balance_percent
+        ) / 100
+
+    def _can_trade(self, balance: Dict) -> bool:
+        """Whether a BUY or SELL could execute with this balance"""
+        return (balance.get('btc', 0) > BTC_DUST
+                or self._trade_amount_usd(balance.get('usd', 0)) >= MIN_ORDER_USD)
+
+    async def _get_balance_and_regime(self) -> Tuple[Dict, Dict]:
+        """Balances, then the AI regime - fresh only if a trade could fire"""
+        balance = await asyncio.to_thread(self._get_balance)
+        fresh = self._can_trade(balance)
+        if not fresh:
+            self.logger.info("No position and USD below minimum order: using stored AI regime")
+        return balance, await asyncio.to_thread(self._get_ai_regime, fresh)
+
+    def _get_ai_regime(self, fresh: bool = True) -> Dict:
+        """Get current AI regime from the service, or the stored one when not fresh"""
         try:
-            from .ai_regime import AIRegimeService
+            if not fresh:
+                return AIRegimeService.get_stored_regime()
             return AIRegimeService.get_current_regime()
         except Exception as e:
             self.logger.warning(f"AI regime fetch failed: {e}")
             return {
-                'regime': MarketRegime.LATERAL.value,
+                'regime': _LATERAL,
                 'confidence': 0.5,
                 'reasoning': 'Default - AI unavailable'
             }
 
+    def _alert(self, message: str) -> None:
+        """Queue a Telegram message for the background sender"""
+        with self._alert_sender_lock:
+            if self._alert_sender is None:
+                self._alert_sender = threading.Thread(
+                    target=self._alert_sender_loop, name="telegram-sender", daemon=True
+                )
+                self._alert_sender.start()
+            self._alert_queue.put(message)
+
+    def _alert_sender_loop(self) -> None:
+        """Send queued alerts, coalescing bursts, until the stop sentinel arrives"""
+        while True:
+            batch = [self._alert_queue.get()]
+            deadline = time.monotonic() + ALERT_COALESCE_WINDOW
+            while None not in batch and len(batch) < ALERT_BATCH:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._alert_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            stopping = None in batch
+            if stopping:
+                # Take everything still queued and retire this sender atomically
+                # with respect to _alert
+                with self._alert_sender_lock:
+                    while True:
+                        try:
+                            batch.append(self._alert_queue.get_nowait())
+                        except queue.Empty:
+                            break
+                    self._alert_sender = None
+
+            messages = [message for message in batch if message is not None]
+            try:
+                if messages and self.telegram:
+                    self.telegram.send_batch(messages)
+            except Exception as e:
+                self.logger.warning(f"Telegram alert failed: {e}")
+
+            if stopping:
+                return
+
+    def flush_alerts(self, timeout: float = 10.0) -> None:
+        """Send all queued alerts and stop the sender thread (restarts on next alert)"""
+        with self._alert_sender_lock:
+            sender = self._alert_sender
+            if sender is None:
+                return
+            self._alert_queue.put(None)
+        sender.join(timeout)
+
+    def _get_ohlcv(self, symbol: str = "BTC/USD", timeframe: str = OHLC_TIMEFRAME,
+                   limit: int = OHLC_LIMIT) -> list:
+        """Get OHLCV candles, reusing the last fetch for up to OHLC_CACHE_TTL seconds
+
+        Once the full history is cached, refreshes only pull candles from the
+        second-to-last one on (covering the still-open candle whichever way
+        the exchange treats `since`) and splice them onto the cached rows.
+        """
+        key = (symbol, timeframe, limit)
+        with self._ohlcv_lock:
+            cached = self._ohlcv_cache.get(key)
+            if cached and time.monotonic() - cached[0] < OHLC_CACHE_TTL:
+                return cached[1]
+
+            if cached and len(cached[1]) >= 2:
+                rows = cached[1]
+                delta = self.client.get_ohlcv(symbol, timeframe, limit=limit, since=rows[-2][0])
+                if not delta:
+                    # Keep serving the old candles; retry the delta next call
+                    return rows
+                first = delta[0][0]
+                if first <= rows[-1][0]:
+                    ohlcv = [row for row in rows if row[0] < first] + delta
+                    ohlcv = ohlcv[-limit:]
+                else:
+                    # Delta doesn't overlap the cache (candles went missing):
+                    # rebuild from a full fetch rather than splice in a gap
+                    ohlcv = self.client.get_ohlcv(symbol, timeframe, limit=limit)
+            else:
+                ohlcv = self.client.get_ohlcv(symbol, timeframe, limit=limit)
+            if ohlcv:
+                self._ohlcv_cache[key] = (time.monotonic(), ohlcv)
+            return ohlcv
+
     def _has_position(self) -> bool:
         """Check if we have an open BTC position"""
         try:
             balance = self._get_balance()
             btc_balance = balance.get('btc', 0)
-            return btc_balance > 0.0001  # More than dust
+            return btc_balance > BTC_DUST  # More than dust
         except Exception:
             return self.active_position is not None
 
@@ -553,8 +969,9 @@ class TradingBot:
         quantity: float,
         regime: str,
         shadow_leverage: float,
-        trade_id: str = None
-    ) -> None:
+        trade_id: str = None,
+        paper_delta: Tuple[float, float] = None
+    ) -> bool:
         """
         Save trade to database with shadow margin tracking.
 
@@ -565,14 +982,13 @@ class TradingBot:
             regime: AI regime at trade time
             shadow_leverage: Shadow leverage (1.0 or 1.5)
             trade_id: Exchange order ID
+            paper_delta: (btc, usd) change applied to the PAPER wallet in the
+                same commit as the trade row (dry run)
+
+        Returns:
+            True if the trade (and wallet change) was committed
         """
         try:
-            from ..database import SessionLocal
-            from ..models import Trade
-            import uuid
-
-            db = SessionLocal()
-
             trade = Trade(
                 trade_id=trade_id or str(uuid.uuid4()),
                 order_type=order_type,
@@ -581,67 +997,139 @@ class TradingBot:
                 exit_price=price if order_type == "SELL" else None,
                 quantity=quantity,
                 status="OPEN" if order_type == "BUY" else "CLOSED",
-                trading_mode="PAPER" if self.dry_run else "REAL",
+                trading_mode="PAPER" if self.cfg.dry_run else "REAL",
                 ai_regime=regime,
                 leverage_used=SPOT_LEVERAGE,  # Always spot
                 shadow_leverage=shadow_leverage,  # Audit field
                 created_at=datetime.now()
             )
 
-            db.add(trade)
-            db.commit()
-            db.close()
+            with SessionLocal() as db:
+                if paper_delta is not None:
+                    status = db.query(BotStatus).filter(BotStatus.trading_mode == "PAPER").first()
+                    if not status:
+                        self.logger.error("Error saving trade to DB: paper wallet not found")
+                        return False
+                    btc_delta, usd_delta = paper_delta
+                    status.btc_balance = max(0.0, (status.btc_balance or 0) + btc_delta)
+                    status.usd_balance = (status.usd_balance or 0) + usd_delta
+                db.add(trade)
+                db.commit()
+                if paper_delta is not None:
+                    self.logger.info("📝 Paper wallet updated: $%.2f USD, %.6f BTC",
+                                     status.usd_balance, status.btc_balance)
 
             self.logger.info(
-                f"💾 Trade saved: {order_type} | Regime: {regime} | "
-                f"Shadow Leverage: x{shadow_leverage}"
+                "💾 Trade saved: %s | Regime: %s | Shadow Leverage: x%s",
+                order_type, regime, shadow_leverage
             )
+            return True
         except Exception as e:
             self.logger.error(f"Error saving trade to DB: {e}")
+            return False
 
     def _save_cycle_to_db(self, cycle_data: Dict, execution_time_ms: int, trigger: str) -> None:
-        """Save trading cycle to database"""
+        """Queue trading cycle for the background DB writer (see flush_cycles)"""
         try:
-            from ..database import SessionLocal
-            from ..models import TradingCycle
-
-            # Build enhanced reason with AI regime reasoning
-            base_reason = cycle_data.get('reason', '')
-            regime_reasoning = cycle_data.get('regime_reasoning', '')
-            if regime_reasoning:
-                enhanced_reason = f"{base_reason} | AI: {regime_reasoning[:100]}"
-            else:
-                enhanced_reason = base_reason
-
-            db = SessionLocal()
-            cycle = TradingCycle(
-                btc_price=cycle_data.get('price', 0),
-                ema20=cycle_data.get('ema20', 0),
-                ema50=cycle_data.get('ema50', 0),
-                rsi14=cycle_data.get('rsi', 0),
-                ema200=cycle_data.get('ema200', 0),
-                btc_balance=cycle_data.get('btc_balance', 0),
-                usd_balance=cycle_data.get('usd_balance', 0),
-                ai_signal=cycle_data.get('signal', 'HOLD'),
-                ai_confidence=cycle_data.get('confidence', 0),
-                ai_reason=enhanced_reason,
-                ai_regime=cycle_data.get('regime', 'LATERAL'),
-                leverage_multiplier=cycle_data.get('shadow_leverage', 1.0),
-                is_winter_mode=cycle_data.get('is_winter_mode', False),
-                action=cycle_data.get('action', 'HOLD'),
-                trade_id=cycle_data.get('trade_id'),
-                execution_time_ms=execution_time_ms,
-                trading_mode="PAPER" if self.dry_run else "REAL",
-                trigger=trigger,
-                error_message=cycle_data.get('error')
+            cycle = _build_cycle_row(
+                cycle_data, "PAPER" if self.cfg.dry_run else "REAL", execution_time_ms, trigger
             )
-            db.add(cycle)
-            db.commit()
-            db.close()
+            with self._cycle_writer_lock:
+                if self._cycle_writer is None:
+                    self._cycle_writer = threading.Thread(
+                        target=self._cycle_writer_loop, name="cycle-writer", daemon=True
+                    )
+                    self._cycle_writer.start()
+                self._cycle_queue.put(cycle)
 
         except Exception as e:
             self.logger.error(f"Error saving cycle to DB: {e}")
 
+    def _cycle_writer_loop(self) -> None:
+        """Commit queued TradingCycle row dicts in batches until the stop sentinel arrives"""
+        while True:
+            batch = [self._cycle_queue.get()]
+            while len(batch) < CYCLE_WRITE_BATCH:
+                try:
+                    batch.append(self._cycle_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stopping = None in batch
+            if stopping:
+                # Take everything still queued and retire this writer atomically
+                # with respect to _save_cycle_to_db
+                with self._cycle_writer_lock:
+                    while True:
+                        try:
+                            batch.append(self._cycle_queue.get_nowait())
+                        except queue.Empty:
+                            break
+                    self._cycle_writer = None
+
+            rows = [cycle for cycle in batch if cycle is not None]
+            try:
+                if rows:
+                    with SessionLocal() as db:
+                        if Config.CYCLE_ORM_INSERTS:
+                            db.add_all([TradingCycle(**row) for row in rows])
+                        else:
+                            db.execute(_CYCLE_INSERT, rows)
+                        db.commit()
+            except Exception as e:
+                self.logger.error(f"Error saving cycle to DB: {e}")
+            finally:
+                for _ in batch:
+                    self._cycle_queue.task_done()
+
+            if stopping:
+                return
+
+    def flush_cycles(self, timeout: float = 10.0) -> None:
+        """Write all queued cycles and stop the writer thread (restarts on next cycle)"""
+        with self._cycle_writer_lock:
+            writer = self._cycle_writer
+            if writer is None:
+                return
+            self._cycle_queue.put(None)
+        writer.join(timeout)
+
+    def _get_indicators(self, timestamps: np.ndarray, closes: np.ndarray) -> Dict[str, float]:
+        """Daily indicators for closes, reused while the latest candle is unchanged"""
+        key = (timestamps[-1], float(closes[-1]), len(closes))
+        memo = self._indicator_memo
+        if memo is not None and memo[0] == key:
+            return memo[1]
+
+        indicators = self._compute_indicators(timestamps, closes)
+        self._indicator_memo = (key, indicators)
+        return indicators
+
+    def _compute_indicators(self, timestamps: np.ndarray, closes: np.ndarray) -> Dict[str, float]:
+        """
+        Daily indicators from the running IndicatorState.
+
+        The last candle is still open; every candle before it is closed. Only
+        the candles closed since the state's last_ts are folded in. Short
+        history, or candles that no longer line up with the state (gap,
+        restart), fall back to a full pass.
+        """
+        n = len(closes)
+        if n < EMA_SLOW:
+            return StrategyEngine.calculate_indicators(closes)
+
+        state = self._indicator_state
+        if state is not None:
+            idx = int(np.searchsorted(timestamps, state.last_ts))
+            if idx < n - 1 and timestamps[idx] == state.last_ts:
+                state.advance(timestamps[-2], closes[idx + 1:n - 1])
+            else:
+                state = None
+        if state is None:
+            state = IndicatorState.from_closes(timestamps[-2], closes[:-1])
+            self._indicator_state = state
+        return state.snapshot(closes[-1])
+
     async def analyze_market(self) -> Dict:
         """
         Analyze current market conditions.
@@ -655,37 +1143,48 @@ class TradingBot:
             Complete market analysis with trading signal
         """
         try:
-            # Fetch DAILY OHLCV data (720 days = ~2 years, enough for EMA200)
-            ohlcv = self.client.get_ohlcv(limit=OHLC_LIMIT)
+            # Fetch DAILY OHLCV (720 days = ~2 years, enough for EMA200), the
+            # CURRENT ticker price, balances and the AI regime concurrently.
+            # The regime waits for the balance: when neither a BUY nor a SELL
+            # could execute, the stored regime is used instead of calling OpenAI
+            ohlcv, ticker, (balance, ai_regime_data) = await asyncio.gather(
+                asyncio.to_thread(self._get_ohlcv, limit=OHLC_LIMIT),
+                asyncio.to_thread(self.client.get_ticker),
+                self._get_balance_and_regime()
+            )
             if not ohlcv or len(ohlcv) < EMA_SLOW:
                 return {'error': f'Insufficient DAILY data: {len(ohlcv) if ohlcv else 0} candles (need {EMA_SLOW}+ for EMA200)'}
 
-            closes = [candle[4] for candle in ohlcv]  # Daily close prices
+            # Candle open times and daily closes as contiguous float64 columns
+            candles = np.asarray(ohlcv, dtype=np.float64)
+            timestamps = as_f64(candles[:, 0])
+            closes = as_f64(candles[:, 4])
 
-            # Get CURRENT ticker price (real-time, not daily close)
-            ticker = self.client.get_ticker()
-            current_price = ticker.get('last', closes[-1])
+            # CURRENT ticker price (real-time, not daily close)
+            current_price = ticker.get('last') or float(closes[-1])
 
-            self.logger.info(f"Daily Levels: Current price ${current_price:,.0f} vs Daily close ${closes[-1]:,.0f}")
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"Daily Levels: Current price ${current_price:,.0f} vs Daily close ${closes[-1]:,.0f}")
 
-            # Get AI regime
-            ai_regime_data = self._get_ai_regime()
-            regime = ai_regime_data.get('regime', MarketRegime.LATERAL.value)
+            # AI regime (fetched alongside the market data above). Interned so
+            # the regime == 'BULL'/... checks hit the identity fast path: strings
+            # parsed from OpenAI JSON or read from the DB are fresh objects
+            regime = ai_regime_data.get('regime', _LATERAL)
+            if isinstance(regime, str):
+                regime = sys.intern(regime)
 
-            # Check position status
-            has_position = self._has_position()
+            # Check position status (same rule as _has_position, reusing the balance)
+            has_position = balance.get('btc', 0) > BTC_DUST
 
             # Get trading signal from strategy engine
             signal = StrategyEngine.get_trading_signal(
                 closes=closes,
                 regime=regime,
                 has_position=has_position,
-                current_price=current_price
+                current_price=current_price,
+                indicators=self._get_indicators(timestamps, closes)
             )
 
-            # Get balances
-            balance = self._get_balance()
-
             # Add balance and regime info to signal
             signal.update({
                 'btc_balance': balance.get('btc', 0),
@@ -704,7 +1203,7 @@ class TradingBot:
         except Exception as e:
             self.logger.error(f"Error analyzing market: {e}")
             if self.telegram:
-                self.telegram.send_error_alert(str(e), 'HIGH')
+                self._alert(self.telegram.error_alert_message(str(e), 'HIGH'))
             return {}
 
     async def execute_buy(self, analysis: Dict) -> bool:
@@ -717,65 +1216,56 @@ class TradingBot:
                 self.logger.warning("Insufficient balance or invalid price")
                 return False
 
-            # Calculate trade amount
-            trade_amount_usd = usd_balance * (self.trade_amount_percent / 100)
-            min_balance = usd_balance * (self.min_balance_percent / 100)
-
-            if trade_amount_usd + min_balance > usd_balance:
-                trade_amount_usd = usd_balance - min_balance
+            trade_amount_usd = self._trade_amount_usd(usd_balance)
 
-            if trade_amount_usd < 10:  # Minimum order size
+            if trade_amount_usd < MIN_ORDER_USD:
                 self.logger.warning(f"Trade amount too small: ${trade_amount_usd:.2f}")
                 return False
 
             btc_quantity = trade_amount_usd / current_price
-            regime = analysis.get('regime', MarketRegime.LATERAL.value)
+            regime = analysis.get('regime', _LATERAL)
             shadow_leverage = analysis.get('shadow_leverage', SPOT_LEVERAGE)
 
-            self.logger.info(
-                f"🟢 EXECUTING BUY: {btc_quantity:.6f} BTC @ ${current_price:,.2f} | "
-                f"Regime: {regime} | Shadow: x{shadow_leverage}"
-            )
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(
+                    f"🟢 EXECUTING BUY: {btc_quantity:.6f} BTC @ ${current_price:,.2f} | "
+                    f"Regime: {regime} | Shadow: x{shadow_leverage}"
+                )
 
-            if self.dry_run:
-                order_id = f"DRY_RUN_{datetime.now().timestamp()}"
-                success = True
-                # Update paper wallet
-                new_usd = usd_balance - trade_amount_usd
-                new_btc = self._get_balance().get('btc', 0) + btc_quantity
-                self._update_paper_balance(btc=new_btc, usd=new_usd)
-                self.logger.info(f"📝 Paper wallet updated: ${new_usd:.2f} USD, {new_btc:.6f} BTC")
+            trade = dict(order_type="BUY", price=current_price, quantity=btc_quantity,
+                         regime=regime, shadow_leverage=shadow_leverage)
+            if self.cfg.dry_run:
+                # Paper wallet change and trade row in one transaction
+                order_id = f"DRY_RUN_{time.time()}"
+                success = await asyncio.to_thread(
+                    self._save_trade_to_db, **trade, trade_id=order_id,
+                    paper_delta=(btc_quantity, -trade_amount_usd)
+                )
             else:
-                result = self.client.create_market_order("BTC/USD", "buy", btc_quantity)
+                result = await asyncio.to_thread(
+                    self.client.create_market_order, "BTC/USD", "buy", btc_quantity
+                )
                 success = result.get('success', False)
                 order_id = result.get('order_id', '')
+                if success:
+                    await asyncio.to_thread(self._save_trade_to_db, **trade, trade_id=order_id)
 
             if success:
-                self.active_position = {
-                    'entry_price': current_price,
-                    'quantity': btc_quantity,
-                    'order_id': order_id,
-                    'regime': regime,
-                    'shadow_leverage': shadow_leverage,
-                    'timestamp': datetime.now().isoformat()
-                }
-
-                # Save to database
-                self._save_trade_to_db(
-                    order_type="BUY",
-                    price=current_price,
+                self.active_position = ActiveTrade(
+                    entry_price=current_price,
                     quantity=btc_quantity,
+                    order_id=order_id,
                     regime=regime,
                     shadow_leverage=shadow_leverage,
-                    trade_id=order_id
+                    timestamp=_now_iso()
                 )
 
                 # Telegram alert
                 if self.telegram:
-                    self.telegram.send_buy_signal(
+                    self._alert(self.telegram.buy_signal_message(
                         current_price, btc_quantity,
                         analysis.get('confidence', 0.7)
-                    )
+                    ))
 
                 return True
 
@@ -790,62 +1280,57 @@ class TradingBot:
         try:
             if not self.active_position:
                 # Check actual balance
-                balance = self._get_balance()
+                balance = await asyncio.to_thread(self._get_balance)
                 btc_balance = balance.get('btc', 0)
-                if btc_balance <= 0.0001:
+                if btc_balance <= BTC_DUST:
                     self.logger.warning("No position to sell")
                     return False
                 quantity = btc_balance
                 entry_price = analysis.get('price', 0)  # Use current as fallback
-                regime = analysis.get('regime', MarketRegime.LATERAL.value)
+                regime = analysis.get('regime', _LATERAL)
                 shadow_leverage = SPOT_LEVERAGE
             else:
-                quantity = self.active_position['quantity']
-                entry_price = self.active_position['entry_price']
-                regime = self.active_position.get('regime', MarketRegime.LATERAL.value)
-                shadow_leverage = self.active_position.get('shadow_leverage', SPOT_LEVERAGE)
+                position = self.active_position
+                quantity = position.quantity
+                entry_price = position.entry_price
+                regime = position.regime
+                shadow_leverage = position.shadow_leverage
 
             current_price = analysis.get('price', 0)
             profit_loss = (current_price - entry_price) * quantity
             profit_pct = ((current_price / entry_price) - 1) * 100 if entry_price > 0 else 0
 
-            self.logger.info(
-                f"🔴 EXECUTING SELL: {quantity:.6f} BTC @ ${current_price:,.2f} | "
-                f"P/L: ${profit_loss:,.2f} ({profit_pct:+.2f}%)"
-            )
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(
+                    f"🔴 EXECUTING SELL: {quantity:.6f} BTC @ ${current_price:,.2f} | "
+                    f"P/L: ${profit_loss:,.2f} ({profit_pct:+.2f}%)"
+                )
 
-            if self.dry_run:
-                order_id = f"DRY_RUN_{datetime.now().timestamp()}"
-                success = True
-                # Update paper wallet
-                sell_value = quantity * current_price
-                new_usd = self._get_balance().get('usd', 0) + sell_value
-                self._update_paper_balance(btc=0, usd=new_usd)
-                self.logger.info(f"📝 Paper wallet updated: ${new_usd:.2f} USD, 0 BTC")
+            trade = dict(order_type="SELL", price=current_price, quantity=quantity,
+                         regime=regime, shadow_leverage=shadow_leverage)
+            if self.cfg.dry_run:
+                # Paper wallet change and trade row in one transaction
+                order_id = f"DRY_RUN_{time.time()}"
+                success = await asyncio.to_thread(
+                    self._save_trade_to_db, **trade, trade_id=order_id,
+                    paper_delta=(-quantity, quantity * current_price)
+                )
             else:
-                result = self.client.create_market_order("BTC/USD", "sell", quantity)
+                result = await asyncio.to_thread(
+                    self.client.create_market_order, "BTC/USD", "sell", quantity
+                )
                 success = result.get('success', False)
                 order_id = result.get('order_id', '')
+                if success:
+                    await asyncio.to_thread(self._save_trade_to_db, **trade, trade_id=order_id)
 
             if success:
-                # Calculate shadow profit
-                shadow_profit = profit_loss * shadow_leverage
-
-                # Save to database
-                self._save_trade_to_db(
-                    order_type="SELL",
-                    price=current_price,
-                    quantity=quantity,
-                    regime=regime,
-                    shadow_leverage=shadow_leverage,
-                    trade_id=order_id
-                )
 
                 # Telegram alert
                 if self.telegram:
-                    self.telegram.send_sell_signal(
+                    self._alert(self.telegram.sell_signal_message(
                         entry_price, current_price, profit_loss, 'STRATEGY_EXIT'
-                    )
+                    ))
 
                 self.active_position = None
                 return True
@@ -860,69 +1345,88 @@ class TradingBot:
         """
         Execute one complete trading cycle.
 
+        Cycles never overlap: if another cycle is already running (e.g. the
+        scheduler while a manual cycle is in flight) this one is skipped
+        rather than queued, so two cycles can't both see no position and buy.
+
         Args:
             trigger: What triggered this cycle ('scheduled', 'manual', 'api')
 
         Returns:
             Cycle result dict
         """
-        import time
+        if not TradingBot._cycle_lock.acquire(blocking=False):
+            self.logger.warning("⏭️ Skipping %s cycle: another cycle is in progress", trigger)
+            return {'success': False, 'reason': 'cycle in progress'}
+        try:
+            return await self._run_cycle(trigger)
+        finally:
+            TradingBot._cycle_lock.release()
+
+    async def _run_cycle(self, trigger: str) -> Dict:
+        """Body of run_cycle, called with _cycle_lock held"""
         start_time = time.time()
+        log = self.logger  # bound once; used on every branch below
 
-        self.logger.info("=" * 60)
-        self.logger.info("📊 STARTING TRADING CYCLE")
-        self.logger.info("=" * 60)
+        log.info(_RULE)
+        log.info("📊 STARTING TRADING CYCLE")
+        log.info(_RULE)
 
         try:
             # Analyze market
             analysis = await self.analyze_market()
 
             if 'error' in analysis:
-                self.logger.error(f"Analysis failed: {analysis['error']}")
+                log.error(f"Analysis failed: {analysis['error']}")
                 return {'success': False, 'error': analysis['error']}
 
-            # Log decision
-            winter_status = "❄️ ON" if analysis.get('is_winter_mode') else "☀️ OFF"
-            self.logger.info(
-                f"[INFO] Winter Mode: {winter_status} | "
-                f"Regime: {analysis.get('regime')} | "
-                f"RSI: {analysis.get('rsi', 0):.0f} | "
-                f"DECISION: {analysis.get('signal')} ({analysis.get('reason')})"
-            )
-            self.logger.info(
-                f"📈 Price: ${analysis.get('price', 0):,.2f} | "
-                f"EMA20: ${analysis.get('ema20', 0):,.2f} | "
-                f"EMA50: ${analysis.get('ema50', 0):,.2f} | "
-                f"EMA200: ${analysis.get('ema200', 0):,.2f}"
-            )
+            signal = analysis.get('signal', _HOLD)
+
+            # Log decision (formatting is skipped entirely when INFO is off;
+            # the price line needs f-strings for thousands separators)
+            if log.isEnabledFor(logging.INFO):
+                get = analysis.get
+                winter_status = "❄️ ON" if get('is_winter_mode') else "☀️ OFF"
+                log.info(
+                    "[INFO] Winter Mode: %s | Regime: %s | RSI: %.0f | DECISION: %s (%s)",
+                    winter_status, get('regime'), get('rsi', 0),
+                    get('signal'), get('reason')
+                )
+                log.info(
+                    f"📈 Price: ${get('price', 0):,.2f} | "
+                    f"EMA20: ${get('ema20', 0):,.2f} | "
+                    f"EMA50: ${get('ema50', 0):,.2f} | "
+                    f"EMA200: ${get('ema200', 0):,.2f}"
+                )
 
             action = 'HOLD'
             trade_id = None
 
-            signal = analysis.get('signal', TradingSignal.HOLD.value)
-
-            if signal == TradingSignal.BUY.value:
-                self.logger.info("✅ BUY SIGNAL TRIGGERED")
-                success = await self.execute_buy(analysis)
-                action = 'BOUGHT' if success else 'BUY_FAILED'
-                if success and self.active_position:
-                    trade_id = self.active_position.get('order_id')
-
-            elif signal == TradingSignal.SELL.value:
-                self.logger.info("✅ SELL SIGNAL TRIGGERED")
-                success = await self.execute_sell(analysis)
-                action = 'SOLD' if success else 'SELL_FAILED'
-            else:
-                self.logger.info("⏸️ HOLDING - No action required")
-
-            # Save cycle to database
+            # Single dispatch on the signal string (literal patterns: a bare
+            # _BUY here would be a capture pattern, not a comparison)
+            match signal:
+                case "BUY":
+                    log.info("✅ BUY SIGNAL TRIGGERED")
+                    success = await self.execute_buy(analysis)
+                    action = 'BOUGHT' if success else 'BUY_FAILED'
+                    if success and self.active_position:
+                        trade_id = self.active_position.order_id
+                case "SELL":
+                    log.info("✅ SELL SIGNAL TRIGGERED")
+                    success = await self.execute_sell(analysis)
+                    action = 'SOLD' if success else 'SELL_FAILED'
+                case _:
+                    log.info("⏸️ HOLDING - No action required")
+
+            # Save cycle to database (plain HOLD cycles only if configured)
             execution_time_ms = int((time.time() - start_time) * 1000)
             analysis['action'] = action
             analysis['trade_id'] = trade_id
-            self._save_cycle_to_db(analysis, execution_time_ms, trigger)
+            if action != 'HOLD' or analysis.get('error') or Config.PERSIST_HOLD_CYCLES:
+                self._save_cycle_to_db(analysis, execution_time_ms, trigger)
 
-            self.logger.info(f"💾 Cycle completed in {execution_time_ms}ms")
-            self.logger.info("=" * 60)
+            log.info("💾 Cycle completed in %dms", execution_time_ms)
+            log.info(_RULE)
 
             return {
                 'success': True,
@@ -932,7 +1436,7 @@ class TradingBot:
             }
 
         except Exception as e:
-            self.logger.error(f"❌ Cycle error: {e}")
+            log.error(f"❌ Cycle error: {e}")
             return {'success': False, 'error': str(e)}
 
     async def start(self):
@@ -940,14 +1444,18 @@ class TradingBot:
         self.is_running = True
         self.logger.info("🟢 Trading Bot Started")
         if self.telegram:
-            self.telegram.send_message("🟢 <b>Trading Bot Started</b> 🟢")
+            self._alert("🟢 <b>Trading Bot Started</b> 🟢")
 
     async def stop(self):
         """Stop the trading bot daemon"""
         self.is_running = False
+        await asyncio.to_thread(self.flush_cycles)
         self.logger.info("🔴 Trading Bot Stopped")
         if self.telegram:
-            self.telegram.send_message("🔴 <b>Trading Bot Stopped</b> 🔴")
+            self._alert("🔴 <b>Trading Bot Stopped</b> 🔴")
+        await asyncio.to_thread(self.flush_alerts)
+        if self.telegram:
+            self.telegram.close()
 
 
 # ============================================================================
@@ -965,6 +1473,7 @@ async def run_dry_cycle():
 
     bot = TradingBot(dry_run=True)
     result = await bot.run_cycle(trigger="dry_run")
+    bot.flush_cycles()
     return result
 
 
@@ -3,13 +3,24 @@ Trailing stop logic for profit protection
 """
 
 import logging
-from typing import Optional, Dict
+from typing import NamedTuple, Optional, Dict
 
 logger = logging.getLogger(__name__)
 
+
+class TSUpdate(NamedTuple):
+    """Per-tick trailing stop result (only the fields that change with price)"""
+    trailing_stop: float
+    distance_to_stop: float
+    should_sell: bool
+
+
 class TrailingStop:
     """Dynamic trailing stop management"""
     
+    # Fixed attribute set: no per-instance __dict__, faster attribute access
+    __slots__ = ('entry_price', 'trailing_percentage', 'highest_price', 'trailing_stop', 'logger')
+    
     def __init__(self, entry_price: float, trailing_percentage: float = 0.99):
         """Initialize trailing stop
         
@@ -23,11 +34,13 @@ class TrailingStop:
         self.trailing_stop = entry_price * trailing_percentage
         self.logger = logger
     
-    def update(self, current_price: float) -> Dict:
+    def update(self, current_price: float) -> TSUpdate:
         """Update trailing stop based on current price
         
         Returns:
-            Dict with updated stop info and whether to sell
+            TSUpdate with the stop level, distance to it and whether to sell.
+            Position constants (entry_price, highest_price, ...) stay on the
+            instance instead of being copied into every tick's result.
         """
         # Update highest price if current is higher
         if current_price > self.highest_price:
@@ -41,20 +54,15 @@ class TrailingStop:
                     f"(highest: ${self.highest_price:,.2f})"
                 )
         
-        # Check if should sell
-        should_sell = current_price <= self.trailing_stop
-        
-        return {
-            'current_price': current_price,
-            'trailing_stop': self.trailing_stop,
-            'highest_price': self.highest_price,
-            'entry_price': self.entry_price,
-            'profit_locked': self.trailing_stop - self.entry_price,
-            'current_profit': current_price - self.entry_price,
-            'should_sell': should_sell,
-            'distance_to_stop': current_price - self.trailing_stop,
-            'stop_percentage': ((current_price - self.trailing_stop) / self.trailing_stop) * 100
-        }
+        return TSUpdate(
+            self.trailing_stop,
+            current_price - self.trailing_stop,
+            current_price <= self.trailing_stop
+        )
+    
+    def stop_percentage(self, current_price: float) -> float:
+        """Distance from price to the stop, as a percentage of the stop"""
+        return ((current_price - self.trailing_stop) / self.trailing_stop) * 100
     
     def to_dict(self) -> Dict:
         """Convert to dictionary for storage"""
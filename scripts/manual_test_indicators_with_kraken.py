@@ -19,11 +19,11 @@ def main() -> None:
 
     ohlc = client.get_ohlc()
     print("OHLC candles received:", len(ohlc))
-    if not ohlc:
+    if len(ohlc) == 0:
         print("No OHLC data returned from Kraken")
         return
 
-    closes = [float(c[4]) for c in ohlc]
+    closes = ohlc[:, 4]
     print("Last 5 closes:", closes[-5:])
 
     signals = TechnicalIndicators.analyze_signals(closes)
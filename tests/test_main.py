@@ -55,3 +55,74 @@ def test_api_status():
     assert response.status_code == 200
     data = response.json()
     assert data["status"] == "active"
+
+def test_indicator_endpoints_serialize_arrays():
+    """Test indicator endpoints return plain JSON lists/numbers"""
+    prices = [100.0 + i + (i % 5) for i in range(60)]
+
+    response = client.post("/api/v1/indicators/ema", json=prices)
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data["values"]) == len(prices)
+    assert data["current"] == data["values"][-1]
+
+    response = client.post("/api/v1/indicators/analyze", json=prices)
+    assert response.status_code == 200
+    data = response.json()
+    assert isinstance(data["ema20_gt_ema50"], bool)
+    assert data["signal"] in ("BUY", "SELL", "HOLD")
+
+def test_risk_profile_update_visible_immediately():
+    """Test risk profile cache is refreshed by PUT"""
+    assert client.get("/api/v1/bot/risk-profile").status_code == 200
+
+    for profile in ("aggressive", "moderate"):
+        response = client.put("/api/v1/bot/risk-profile", json={"profile": profile})
+        assert response.status_code == 200
+
+        data = client.get("/api/v1/bot/risk-profile").json()
+        assert data["profile"] == profile
+        assert "message" not in data
+
+def test_current_indicators_use_shared_kraken_client():
+    """Test /indicators/current usa el cliente público compartido de Kraken"""
+    from unittest.mock import Mock, patch
+    import numpy as np
+    from app.services.ai_regime import AIRegimeService
+
+    kraken = Mock()
+    kraken.get_ticker.return_value = {'c': ['50000.0', '0.1']}
+    kraken.get_ohlc.return_value = np.array(
+        [[1700000000 + i * 14400, 0, 0, 0, 100.0 + i, 0, 1.0, 1] for i in range(60)],
+        dtype=np.float64
+    )
+
+    with patch('app.services.kraken_client.get_public_client', return_value=kraken), \
+         patch.object(AIRegimeService, 'get_current_regime', return_value=AIRegimeService.DEFAULT_PARAMS):
+        response = client.get("/api/v1/indicators/current")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert "error" not in data
+    assert data["price"] == 50000.0
+    assert data["timestamp"] == 1700000000 + 59 * 14400
+
+def test_bot_indicators_use_shared_kraken_client():
+    """Test /bot/indicators/{pair} usa el cliente público compartido de Kraken"""
+    from unittest.mock import Mock, patch
+    import numpy as np
+
+    kraken = Mock()
+    kraken.get_ohlc.return_value = np.array(
+        [[1700000000 + i * 3600, 0, 0, 0, 100.0 + i + (i % 5), 0, 1.0, 1] for i in range(60)],
+        dtype=np.float64
+    )
+
+    with patch('app.routers.bot.get_public_client', return_value=kraken):
+        response = client.get("/api/v1/bot/indicators/XBTUSDT")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert "error" not in data
+    assert data["signal"] in ("BUY", "SELL", "HOLD")
+    kraken.get_ohlc.assert_called_once_with("XBTUSDT")
@@ -174,6 +174,21 @@ def test_paper_engine_trade_logging(clean_db, paper_engine):
     finally:
         db.close()
 
+def test_paper_engine_buy_is_atomic(clean_db, paper_engine, monkeypatch):
+    """Test que un fallo al guardar el trade no modifica el wallet"""
+    class BrokenTrade:
+        def __init__(self, **kwargs):
+            raise RuntimeError("insert failed")
+
+    monkeypatch.setattr('app.services.modes.paper.Trade', BrokenTrade)
+    success, _ = paper_engine.buy(50000.0, 200.0)
+
+    assert success is False
+    wallet = paper_engine.get_wallet_summary()
+    assert wallet['usd_balance'] == 1000.0
+    assert wallet['btc_balance'] == 0.0
+    assert wallet['last_buy_price'] is None
+
 def test_factory_pattern_paper_mode(monkeypatch):
     """Test que factory retorna PaperTradingEngine en modo PAPER"""
     monkeypatch.setenv('TRADING_MODE', 'PAPER')
@@ -189,6 +204,28 @@ def test_factory_pattern_paper_mode(monkeypatch):
         engine = get_trading_engine()
         assert isinstance(engine, PaperTradingEngine)
 
+def test_factory_reuses_engine(monkeypatch):
+    """Test que factory reutiliza la misma instancia entre llamadas"""
+    from app.services.modes import factory
+    from app.services.modes.real import RealTradingEngine
+
+    monkeypatch.setattr(factory, "_cached_engine", None)
+    monkeypatch.setattr(factory, "MODE", "PAPER")
+    engine = get_trading_engine()
+    assert get_trading_engine() is engine
+
+    # Otro cliente de Kraken es otra clave de caché: instancia nueva
+    client = object()
+    other = get_trading_engine(client)
+    assert other is not engine
+    assert get_trading_engine(client) is other
+
+    # Cambiar MODE también crea un motor nuevo
+    monkeypatch.setattr(factory, "MODE", "REAL")
+    real = get_trading_engine(client)
+    assert isinstance(real, RealTradingEngine)
+    assert real is not other
+
 def test_get_open_position_none(clean_db, paper_engine):
     """Test que no hay posición abierta sin compra"""
     position = paper_engine.get_open_position()
@@ -221,3 +258,24 @@ def test_load_balances(clean_db, paper_engine):
     assert 'usd' in balances
     assert isinstance(balances['btc'], float)
     assert isinstance(balances['usd'], float)
+
+def test_bot_dry_run_trades_update_wallet(clean_db):
+    """Test compra/venta del bot en dry run: billetera y trade en la misma transacción"""
+    import asyncio
+    from app.services.trading_bot import TradingBot
+
+    bot = TradingBot(dry_run=True, trade_amount_percent=50.0, min_balance_percent=20.0)
+    analysis = {'price': 50000.0, 'usd_balance': 1000.0, 'regime': 'BULL'}
+
+    assert asyncio.run(bot.execute_buy(analysis)) is True
+    assert bot._get_paper_balance() == pytest.approx({'btc': 0.01, 'usd': 500.0})
+
+    assert asyncio.run(bot.execute_sell({'price': 60000.0})) is True
+    assert bot._get_paper_balance() == pytest.approx({'btc': 0.0, 'usd': 1100.0})
+
+    db = SessionLocal()
+    try:
+        trades = db.query(Trade).filter(Trade.trading_mode == "PAPER").order_by(Trade.id).all()
+        assert [t.order_type for t in trades] == ["BUY", "SELL"]
+    finally:
+        db.close()
@@ -11,6 +11,7 @@ Backtest reference: +2990% vs Buy & Hold +601% (2018-2025)
 
 import pytest
 import pandas as pd
+import numpy as np
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime
 
@@ -326,6 +327,91 @@ class TestIndicatorCalculation:
         assert 'rsi14' in indicators
         assert 'close' in indicators
 
+    def test_ema200_matches_pandas(self):
+        """EMA200 kernel matches pandas ewm(span=200, adjust=False)"""
+        prices = [100 + (i % 17) * 3.5 - (i % 5) for i in range(300)]
+        series = pd.Series(prices, dtype=float)
+
+        indicators = StrategyEngine.calculate_indicators(series)
+        expected = series.ewm(span=200, adjust=False).mean().iloc[-1]
+
+        assert indicators['ema200'] == pytest.approx(expected, rel=1e-12)
+
+    def test_fast_emas_match_pandas(self):
+        """EMA20/EMA50 kernels match pandas ewm(adjust=False)"""
+        prices = [100 + (i % 13) * 2.5 - (i % 7) for i in range(120)]
+        series = pd.Series(prices, dtype=float)
+
+        indicators = StrategyEngine.calculate_indicators(series)
+
+        assert indicators['ema20'] == pytest.approx(series.ewm(span=20, adjust=False).mean().iloc[-1], rel=1e-12)
+        assert indicators['ema50'] == pytest.approx(series.ewm(span=50, adjust=False).mean().iloc[-1], rel=1e-12)
+
+    def test_float32_prices_stay_within_tolerance(self):
+        """float32 price input stays within 1e-4 of the float64 reference"""
+        rng = np.random.default_rng(42)
+        closes = 60000 * np.exp(np.cumsum(rng.normal(0, 0.02, 1000)))
+        series = pd.Series(closes)
+
+        indicators = StrategyEngine.calculate_indicators(series)
+
+        for key, span in (('ema20', 20), ('ema50', 50), ('ema200', 200)):
+            expected = series.ewm(span=span, adjust=False).mean().iloc[-1]
+            assert indicators[key] == pytest.approx(expected, rel=1e-4)
+        expected_rsi = TestIndicatorCalculation._wilder_rsi_f64(closes, 14)
+        assert indicators['rsi14'] == pytest.approx(expected_rsi, abs=1e-4)
+        assert indicators['close'] == closes[-1]
+
+    @staticmethod
+    def _wilder_rsi_f64(closes, period):
+        deltas = np.diff(closes)
+        gain = np.clip(deltas[:period], 0, None).mean()
+        loss = np.clip(-deltas[:period], 0, None).mean()
+        for d in deltas[period:]:
+            gain = (gain * (period - 1) + max(d, 0.0)) / period
+            loss = (loss * (period - 1) + max(-d, 0.0)) / period
+        return 100.0 - 100.0 / (1.0 + gain / loss)
+
+    def test_list_array_and_series_inputs_agree(self):
+        """calculate_indicators gives the same result for a list, ndarray or Series"""
+        prices = [100 + (i % 11) * 1.5 for i in range(250)]
+
+        expected = StrategyEngine.calculate_indicators(pd.Series(prices))
+
+        assert StrategyEngine.calculate_indicators(prices) == expected
+        assert StrategyEngine.calculate_indicators(np.array(prices)) == expected
+
+    def test_fused_kernel_matches_references(self):
+        """The fused daily pass equals pandas EMAs and Wilder's reference RSI"""
+        from app.services.trading_bot import _daily_levels, _rsi_value
+
+        prices = np.ascontiguousarray(100 + 10 * np.sin(np.arange(300) / 7.0))
+        ema20, ema50, ema200, gain, loss = _daily_levels(prices, 14)
+
+        series = pd.Series(prices)
+        assert (ema20, ema50, ema200) == pytest.approx(
+            tuple(series.ewm(span=span, adjust=False).mean().iloc[-1] for span in (20, 50, 200)), rel=1e-12)
+        assert _rsi_value(gain, loss) == pytest.approx(
+            TestIndicatorCalculation._wilder_rsi_f64(prices, 14), rel=1e-9)
+        assert _daily_levels(prices[:10], 14)[3:] == (0.0, 0.0)
+
+    def test_kernel_warm_up(self):
+        """Warm-up compiles every kernel without touching market data"""
+        from app.services import technical_indicators, trading_bot
+
+        technical_indicators.warm_up_kernels()
+        trading_bot.warm_up_kernels()
+
+    def test_rsi_uses_wilder_smoothing(self):
+        """RSI matches Wilder's reference values (StockCharts sample data)"""
+        closes = [44.34, 44.09, 44.15, 43.61, 44.33, 44.83, 45.10, 45.42, 45.84,
+                  46.08, 45.89, 46.03, 45.61, 46.28, 46.28, 46.00, 46.03, 46.41]
+
+        rsi = [StrategyEngine.calculate_indicators(pd.Series(closes[:n]))['rsi14']
+               for n in range(15, 19)]
+
+        assert rsi == pytest.approx([70.46, 66.25, 66.48, 69.35], abs=0.01)
+
     def test_insufficient_data_handling(self):
         """Should handle insufficient data gracefully"""
         closes = list(range(1, 30))  # Only 29 prices
@@ -414,6 +500,640 @@ class TestShadowMarginDatabase:
             assert call_args.kwargs.get('shadow_leverage') == 1.5 or \
                    (len(call_args.args) > 4 and call_args.args[4] == 1.5)
 
+    @patch('app.services.trading_bot.TradingBot._save_trade_to_db')
+    def test_sell_closes_active_trade(self, mock_save):
+        """SELL uses the ActiveTrade opened by the BUY and clears it"""
+        import asyncio
+        from app.services.trading_bot import TradingBot, ActiveTrade
+
+        bot = TradingBot()
+        bot.client = Mock()
+        bot.client.create_market_order.return_value = {'success': True, 'order_id': 'SELL-1'}
+        bot.active_position = ActiveTrade(
+            entry_price=40000.0, quantity=0.25, order_id='BUY-1',
+            regime=MarketRegime.BULL.value, shadow_leverage=1.5, timestamp='2024-01-01T00:00:00'
+        )
+
+        assert asyncio.run(bot.execute_sell({'price': 50000.0})) is True
+
+        bot.client.create_market_order.assert_called_once_with("BTC/USD", "sell", 0.25)
+        assert mock_save.call_args.kwargs['regime'] == MarketRegime.BULL.value
+        assert mock_save.call_args.kwargs['shadow_leverage'] == 1.5
+        assert bot.active_position is None
+
+
+class TestOhlcvCache:
+    """
+    Test daily candles are reused between close cycles
+    """
+
+    def test_ohlcv_fetched_once_within_ttl(self):
+        """Second fetch within the TTL should not hit the exchange"""
+        from app.services.trading_bot import TradingBot
+
+        bot = TradingBot()
+        bot.client = Mock()
+        bot.client.get_ohlcv.return_value = [[0, 1, 2, 0.5, 1.5, 10]]
+
+        first = bot._get_ohlcv()
+        second = bot._get_ohlcv()
+
+        assert first is second
+        assert bot.client.get_ohlcv.call_count == 1
+
+    def test_empty_ohlcv_not_cached(self):
+        """Failed fetches (empty list) should be retried next time"""
+        from app.services.trading_bot import TradingBot
+
+        bot = TradingBot()
+        bot.client = Mock()
+        bot.client.get_ohlcv.return_value = []
+
+        bot._get_ohlcv()
+        bot._get_ohlcv()
+
+        assert bot.client.get_ohlcv.call_count == 2
+
+    def test_expired_cache_pulls_only_new_candles(self):
+        """After the TTL only candles since the previous one are fetched and spliced in"""
+        from app.services import trading_bot
+        from app.services.trading_bot import TradingBot
+
+        bot = TradingBot()
+        bot.client = Mock()
+        bot.client.get_ohlcv.return_value = [[t, 1, 2, 0.5, 1.0 + t, 10] for t in range(5)]
+        bot._get_ohlcv(limit=5)
+
+        # Open candle 4 moved and candle 5 appeared
+        bot.client.get_ohlcv.return_value = [[3, 1, 2, 0.5, 4.0, 10], [4, 1, 2, 0.5, 9.0, 10],
+                                             [5, 1, 2, 0.5, 6.0, 10]]
+        with patch.object(trading_bot, 'OHLC_CACHE_TTL', 0):
+            ohlcv = bot._get_ohlcv(limit=5)
+
+        assert bot.client.get_ohlcv.call_args.kwargs['since'] == 3
+        assert [row[0] for row in ohlcv] == [1, 2, 3, 4, 5]
+        assert ohlcv[-2][4] == 9.0
+
+    def test_non_overlapping_delta_triggers_full_fetch(self):
+        """A delta that skips past the cached candles is replaced by a full fetch"""
+        from app.services import trading_bot
+        from app.services.trading_bot import TradingBot
+
+        bot = TradingBot()
+        bot.client = Mock()
+        bot.client.get_ohlcv.return_value = [[t, 1, 2, 0.5, 1.0, 10] for t in range(5)]
+        bot._get_ohlcv(limit=5)
+
+        full = [[t, 1, 2, 0.5, 1.0, 10] for t in range(4, 9)]
+        bot.client.get_ohlcv.side_effect = [[[7, 1, 2, 0.5, 1.0, 10], [8, 1, 2, 0.5, 1.0, 10]], full]
+        with patch.object(trading_bot, 'OHLC_CACHE_TTL', 0):
+            ohlcv = bot._get_ohlcv(limit=5)
+
+        assert 'since' not in bot.client.get_ohlcv.call_args.kwargs
+        assert ohlcv == full
+
+
+class TestAnalyzeMarket:
+    """
+    Test analyze_market wiring with a mocked exchange client
+    """
+
+    def test_analyze_market_uses_daily_closes(self):
+        """Closes column feeds the strategy and ticker price drives the decision"""
+        import asyncio
+        from app.services.trading_bot import TradingBot
+
+        bot = TradingBot()
+        bot.client = Mock()
+        bot.client.get_ohlcv.return_value = [
+            [i * 86400000, 100.0 + i, 101.0 + i, 99.0 + i, 100.5 + i, 10.0]
+            for i in range(250)
+        ]
+        bot.client.get_ticker.return_value = {'last': 400.0}
+        bot.client.get_balance.return_value = {'btc': 0, 'usd': 1000}
+
+        with patch.object(TradingBot, '_get_ai_regime',
+                          return_value={'regime': MarketRegime.BULL.value}):
+            analysis = asyncio.run(bot.analyze_market())
+
+        expected = StrategyEngine.get_trading_signal(
+            closes=[100.5 + i for i in range(250)],
+            regime=MarketRegime.BULL.value,
+            has_position=False,
+            current_price=400.0
+        )
+        assert analysis['price'] == 400.0
+        assert analysis['ema200'] == pytest.approx(expected['ema200'])
+        assert analysis['signal'] == expected['signal']
+
+    def test_regime_not_refreshed_when_no_trade_possible(self):
+        """Without a position or enough USD for an order, OpenAI is not called"""
+        import asyncio
+        from app.services.ai_regime import AIRegimeService
+        from app.services.trading_bot import TradingBot
+
+        bot = TradingBot()
+        bot.client = Mock()
+        bot.client.get_ohlcv.return_value = [
+            [i * 86400000, 100.0, 101.0, 99.0, 100.5, 10.0] for i in range(250)
+        ]
+        bot.client.get_ticker.return_value = {'last': 100.0}
+
+        with patch.object(AIRegimeService, 'get_current_regime') as mock_live, \
+             patch.object(AIRegimeService, 'get_stored_regime',
+                          return_value={'regime': MarketRegime.BEAR.value}) as mock_stored:
+            bot.client.get_balance.return_value = {'btc': 0, 'usd': 5}
+            analysis = asyncio.run(bot.analyze_market())
+            assert analysis['regime'] == MarketRegime.BEAR.value
+            mock_live.assert_not_called()
+            mock_stored.assert_called_once()
+
+            bot.client.get_balance.return_value = {'btc': 0.5, 'usd': 5}
+            asyncio.run(bot.analyze_market())
+            mock_live.assert_called_once()
+
+    def test_indicators_reused_while_candle_unchanged(self):
+        """Indicators are recomputed only when the latest daily candle changes"""
+        from app.services.trading_bot import TradingBot
+
+        bot = TradingBot()
+        closes = np.linspace(100.0, 200.0, 250)
+        timestamps = np.arange(250) * 86400.0
+
+        with patch.object(TradingBot, '_compute_indicators',
+                          autospec=True, side_effect=TradingBot._compute_indicators) as mock_calc:
+            first = bot._get_indicators(timestamps, closes)
+            assert bot._get_indicators(timestamps, closes) is first
+            assert mock_calc.call_count == 1
+
+            moved = closes.copy()
+            moved[-1] += 1.0
+            assert bot._get_indicators(timestamps, moved)['close'] == pytest.approx(201.0)
+            assert mock_calc.call_count == 2
+
+    def test_indicator_state_advances_with_new_candles(self):
+        """Closed candles are folded in incrementally and match a full recompute"""
+        from app.services.trading_bot import TradingBot, IndicatorState
+
+        rng = np.random.default_rng(7)
+        closes = 60000 * np.exp(np.cumsum(rng.normal(0, 0.02, 722)))
+        timestamps = np.arange(722) * 86400.0
+        bot = TradingBot()
+
+        bot._get_indicators(timestamps[:720], closes[:720])
+        state = bot._indicator_state
+        assert state.last_ts == timestamps[718]
+
+        # Two more days: the window slides by two, two new candles close
+        with patch.object(IndicatorState, 'from_closes') as mock_cold:
+            incremental = bot._get_indicators(timestamps[2:], closes[2:])
+        mock_cold.assert_not_called()
+        assert bot._indicator_state is state
+        assert state.last_ts == timestamps[720]
+
+        full = StrategyEngine.calculate_indicators(pd.Series(closes))
+        for key in ('ema20', 'ema50', 'ema200', 'rsi14', 'close'):
+            assert incremental[key] == pytest.approx(full[key], rel=1e-4)
+
+    def test_indicator_state_cold_start_matches_advance(self):
+        """A cold start and an advanced state give the same values (both float64)"""
+        from app.services.trading_bot import IndicatorState
+
+        rng = np.random.default_rng(3)
+        closes = 60000 * np.exp(np.cumsum(rng.normal(0, 0.02, 400)))
+
+        advanced = IndicatorState.from_closes(0, closes[:300])
+        advanced.advance(1, closes[300:])
+        cold = IndicatorState.from_closes(1, closes)
+
+        assert advanced.snapshot(closes[-1]) == pytest.approx(cold.snapshot(closes[-1]), rel=1e-12)
+
+    def test_indicator_state_rebuilds_on_gap(self):
+        """Candles that no longer contain the state's last candle trigger a full pass"""
+        from app.services.trading_bot import TradingBot
+
+        closes = np.linspace(100.0, 300.0, 600)
+        timestamps = np.arange(600) * 86400.0
+        bot = TradingBot()
+
+        bot._get_indicators(timestamps[:250], closes[:250])
+        first_state = bot._indicator_state
+        bot._get_indicators(timestamps[350:], closes[350:])
+
+        assert bot._indicator_state is not first_state
+        assert bot._indicator_state.last_ts == timestamps[-2]
+
+
+class TestCycleWriter:
+    """
+    Test write-behind persistence of trading cycles
+    """
+
+    @pytest.mark.parametrize("orm_inserts", [False, True])
+    def test_queued_cycles_are_written_on_flush(self, orm_inserts):
+        """Cycles queued by _save_cycle_to_db are committed by flush_cycles"""
+        from app.config import Config
+        from app.services.trading_bot import TradingBot
+        from app.database import SessionLocal, engine, Base
+        from app.models import TradingCycle
+
+        Base.metadata.create_all(bind=engine)
+        bot = TradingBot()
+        try:
+            Config.CYCLE_ORM_INSERTS = orm_inserts
+            for price in (50000.0, 51000.0):
+                bot._save_cycle_to_db({'price': price, 'rsi': 55.0, 'action': 'HOLD'}, 5, 'test-writer')
+            bot.flush_cycles()
+
+            assert bot._cycle_writer is None
+            with SessionLocal() as db:
+                cycles = db.query(TradingCycle).filter(TradingCycle.trigger == 'test-writer').all()
+                prices = sorted(c.btc_price for c in cycles)
+                assert all(c.rsi14 == 55.0 and c.ai_regime == 'LATERAL' for c in cycles)
+            assert prices == [50000.0, 51000.0]
+        finally:
+            Config.CYCLE_ORM_INSERTS = False
+            with SessionLocal() as db:
+                db.query(TradingCycle).filter(TradingCycle.trigger == 'test-writer').delete()
+                db.commit()
+
+    def test_build_cycle_row(self):
+        """Row maps analysis keys to columns and appends the AI regime reasoning"""
+        from app.services.trading_bot import _build_cycle_row
+
+        row = _build_cycle_row(
+            {'price': 50000.0, 'signal': 'BUY', 'reason': 'Breakout', 'regime_reasoning': 'x' * 150},
+            'PAPER', 7, 'manual'
+        )
+
+        assert row['btc_price'] == 50000.0
+        assert row['ai_signal'] == 'BUY'
+        assert row['ai_regime'] == 'LATERAL'
+        assert row['ai_reason'] == 'Breakout | AI: ' + 'x' * 100
+        assert (row['execution_time_ms'], row['trading_mode'], row['trigger']) == (7, 'PAPER', 'manual')
+        assert _build_cycle_row({'reason': 'Hold'}, 'REAL', 1, 'scheduled')['ai_reason'] == 'Hold'
+
+
+class TestTradeSizing:
+    """
+    Test BUY size respects trade % and reserve %
+    """
+
+    @pytest.mark.parametrize("trade_pct,reserve_pct,expected_usd", [
+        (75.0, 20.0, 750.0),   # Trade % fits alongside the reserve
+        (90.0, 20.0, 800.0),   # Capped to keep 20% in reserve
+    ])
+    def test_buy_amount(self, trade_pct, reserve_pct, expected_usd):
+        """Order quantity is min(trade %, 100 - reserve %) of USD balance"""
+        import asyncio
+        from app.services.trading_bot import TradingBot
+
+        bot = TradingBot(trade_amount_percent=trade_pct, min_balance_percent=reserve_pct)
+        bot.client = Mock()
+        bot.client.create_market_order.return_value = {'success': True, 'order_id': 'T1'}
+
+        analysis = {'price': 50000, 'usd_balance': 1000, 'regime': MarketRegime.BULL.value}
+        with patch.object(TradingBot, '_save_trade_to_db'):
+            assert asyncio.run(bot.execute_buy(analysis)) is True
+
+        _, side, quantity = bot.client.create_market_order.call_args.args
+        assert side == "buy"
+        assert quantity == pytest.approx(expected_usd / 50000)
+
+
+class TestTelegramAlerts:
+    """
+    Test Telegram alerts do not block trade execution
+    """
+
+    def test_buy_alert_sent_in_background(self):
+        """BUY returns before the Telegram call finishes; flush_alerts waits for it"""
+        import asyncio
+        import threading
+        from app.services.telegram_alerts import TelegramAlerts
+        from app.services.trading_bot import TradingBot
+
+        release = threading.Event()
+        bot = TradingBot()
+        bot.client = Mock()
+        bot.client.create_market_order.return_value = {'success': True, 'order_id': 'T1'}
+        bot.telegram = Mock(buy_signal_message=TelegramAlerts.buy_signal_message)
+        bot.telegram.send_batch.side_effect = lambda messages: release.wait(5)
+
+        analysis = {'price': 50000, 'usd_balance': 10000, 'regime': MarketRegime.BULL.value}
+        with patch.object(TradingBot, '_save_trade_to_db'):
+            assert asyncio.run(bot.execute_buy(analysis)) is True
+
+        assert bot._alert_sender is not None
+        release.set()
+        bot.flush_alerts()
+        assert bot._alert_sender is None
+        messages = bot.telegram.send_batch.call_args[0][0]
+        assert len(messages) == 1 and 'BUY SIGNAL' in messages[0]
+
+    def test_alert_burst_is_coalesced(self):
+        """Alerts queued together go out in one Telegram send"""
+        from app.services.trading_bot import TradingBot
+
+        bot = TradingBot()
+        bot.telegram = Mock()
+        for n in range(3):
+            bot._alert(f"alert {n}")
+        bot.flush_alerts()
+        bot.telegram.send_batch.assert_called_once_with(["alert 0", "alert 1", "alert 2"])
+
+    def test_send_batch_respects_length_limit(self):
+        """send_batch packs messages into as few sends as the limit allows"""
+        from app.services.telegram_alerts import TelegramAlerts, MAX_MESSAGE_LENGTH
+
+        alerts = TelegramAlerts("token", "chat")
+        with patch.object(alerts, 'send_message', return_value=True) as mock_send:
+            assert alerts.send_batch(["a" * 10, "b" * 10]) is True
+            assert mock_send.call_count == 1
+            assert alerts.send_batch(["a" * MAX_MESSAGE_LENGTH, "b" * 10]) is True
+            assert mock_send.call_count == 3
+
+    def test_messages_share_one_session(self):
+        """Every alert goes through the same keep-alive requests.Session"""
+        from app.services.telegram_alerts import TelegramAlerts
+
+        alerts = TelegramAlerts("token", "chat")
+        with patch.object(alerts.session, 'post', return_value=Mock(status_code=200)) as mock_post:
+            assert alerts.send_message("one") is True
+            assert alerts.send_message("two") is True
+        assert mock_post.call_count == 2
+
+
+class TestHoldCyclePersistence:
+    """
+    Test PERSIST_HOLD_CYCLES toggle in run_cycle
+    """
+
+    def _run_hold_cycle(self, persist: bool):
+        import asyncio
+        from app.config import Config
+        from app.services.trading_bot import TradingBot
+
+        bot = TradingBot()
+        analysis = {'signal': TradingSignal.HOLD.value, 'reason': 'HOLD', 'price': 50000.0}
+        with patch.object(TradingBot, 'analyze_market', return_value=analysis), \
+                patch.object(TradingBot, '_save_cycle_to_db') as mock_save, \
+                patch.object(Config, 'PERSIST_HOLD_CYCLES', persist):
+            result = asyncio.run(bot.run_cycle(trigger='test'))
+        assert result['action'] == 'HOLD'
+        return mock_save
+
+    def test_hold_cycle_saved_by_default(self):
+        """HOLD cycles are persisted when PERSIST_HOLD_CYCLES is on"""
+        assert self._run_hold_cycle(True).called
+
+    def test_hold_cycle_skipped_when_disabled(self):
+        """HOLD cycles are not persisted when PERSIST_HOLD_CYCLES is off"""
+        assert not self._run_hold_cycle(False).called
+
+
+class TestCycleDispatch:
+    """
+    Test run_cycle routes each signal to the right action
+    """
+
+    @pytest.mark.parametrize("signal,buy_ok,sell_ok,expected", [
+        (TradingSignal.BUY.value, True, None, 'BOUGHT'),
+        (TradingSignal.BUY.value, False, None, 'BUY_FAILED'),
+        (TradingSignal.SELL.value, None, True, 'SOLD'),
+        (TradingSignal.HOLD.value, None, None, 'HOLD'),
+    ])
+    def test_signal_maps_to_action(self, signal, buy_ok, sell_ok, expected):
+        """BUY/SELL execute their order, anything else holds"""
+        import asyncio
+        from app.services.trading_bot import TradingBot
+
+        bot = TradingBot()
+        with patch.object(TradingBot, 'analyze_market', return_value={'signal': signal}), \
+             patch.object(TradingBot, 'execute_buy', return_value=buy_ok) as mock_buy, \
+             patch.object(TradingBot, 'execute_sell', return_value=sell_ok) as mock_sell, \
+             patch.object(TradingBot, '_save_cycle_to_db'):
+            result = asyncio.run(bot.run_cycle())
+
+        assert result['action'] == expected
+        assert mock_buy.called == (buy_ok is not None)
+        assert mock_sell.called == (sell_ok is not None)
+
+
+class TestCycleLock:
+    """
+    Test overlapping cycles are skipped
+    """
+
+    def test_overlapping_cycle_is_skipped(self):
+        """A second run_cycle while one is in flight returns without trading"""
+        import asyncio
+        from app.services.trading_bot import TradingBot
+
+        scheduled, manual = TradingBot(), TradingBot()
+
+        async def slow_analysis():
+            await asyncio.sleep(0.2)
+            return {'error': 'stop here'}
+
+        async def scenario():
+            with patch.object(TradingBot, 'analyze_market', side_effect=slow_analysis) as mock_analyze:
+                first = asyncio.create_task(scheduled.run_cycle())
+                await asyncio.sleep(0.05)
+                second = await manual.run_cycle(trigger="manual")
+                await first
+                return second, mock_analyze.call_count
+
+        second, calls = asyncio.run(scenario())
+        assert second == {'success': False, 'reason': 'cycle in progress'}
+        assert calls == 1
+        assert not TradingBot._cycle_lock.locked()
+
+
+class TestAIRegimeClient:
+    """
+    Test AIRegimeService reuses its Kraken client and live answers
+    """
+
+    def test_live_regime_is_cached(self):
+        """A successful OpenAI regime is reused until the TTL or force_refresh"""
+        from app.services import ai_regime
+        from app.services.ai_regime import AIRegimeService
+
+        ai_regime._regime_cache.invalidate()
+        with patch.object(AIRegimeService, '_call_openai',
+                          return_value={'regime': 'BULL', 'confidence': 0.9}) as mock_call, \
+             patch.object(AIRegimeService, '_apply_momentum_multiplier', side_effect=lambda r: r), \
+             patch.object(AIRegimeService, '_save_to_db'):
+            first = AIRegimeService.get_current_regime()
+            assert AIRegimeService.get_current_regime() == first
+            assert mock_call.call_count == 1
+
+            AIRegimeService.force_refresh()
+            assert mock_call.call_count == 2
+        ai_regime._regime_cache.invalidate()
+
+    def test_failed_regime_is_not_cached(self):
+        """Fallback answers are not cached, so the next call retries OpenAI"""
+        from app.services import ai_regime
+        from app.services.ai_regime import AIRegimeService
+
+        ai_regime._regime_cache.invalidate()
+        with patch.object(AIRegimeService, '_call_openai', return_value=None) as mock_call, \
+             patch.object(AIRegimeService, '_get_from_db', return_value=None):
+            AIRegimeService.get_current_regime()
+            AIRegimeService.get_current_regime()
+        assert mock_call.call_count == 2
+
+    def test_public_client_is_reused(self):
+        """Market data fetches share one KrakenClient (and its HTTP session)"""
+        from app.services.kraken_client import get_public_client
+
+        with patch('app.services.kraken_client._public_client', None):
+            first = get_public_client()
+            assert get_public_client() is first
+
+    def test_market_data_rsi_and_volume_match_rolling(self):
+        """Tail-window RSI and volume average equal the last rolling-mean values"""
+        from app.services.ai_regime import AIRegimeService
+
+        rng = np.random.default_rng(3)
+        ohlc = np.zeros((300, 8))
+        ohlc[:, 4] = 60000 * np.exp(np.cumsum(rng.normal(0, 0.02, 300)))
+        ohlc[:, 6] = rng.uniform(100, 200, 300)
+        client = Mock()
+        client.get_ohlc.return_value = ohlc
+
+        with patch('app.services.ai_regime.get_public_client', return_value=client):
+            data = AIRegimeService._fetch_market_data()
+
+        close, volume = pd.Series(ohlc[:, 4]), pd.Series(ohlc[:, 6])
+        delta = close.diff()
+        gain = delta.where(delta > 0, 0).rolling(window=14).mean().iloc[-1]
+        loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean().iloc[-1]
+        assert data['rsi'] == pytest.approx(100 - 100 / (1 + gain / loss))
+        assert data['volume_ratio'] == pytest.approx(volume.iloc[-1] / volume.rolling(20).mean().iloc[-1])
+
+
+class TestKrakenOhlc:
+    """
+    Test KrakenClient returns OHLC as a float64 array
+    """
+
+    def test_get_ohlc_parses_rows_once(self):
+        """String rows come back as an (N, 8) float64 array; errors give an empty one"""
+        from app.services.kraken_client import KrakenClient
+
+        client = KrakenClient(api_key="", api_secret="")
+        client.api = Mock()
+        client.api.query_public.return_value = {'error': [], 'result': {'XBTUSDT': [
+            [1700000000, "100.0", "101.0", "99.0", "100.5", "100.2", "3.5", 12]
+        ] * 3}}
+
+        ohlc = client.get_ohlc()
+        assert ohlc.dtype == np.float64 and ohlc.shape == (3, 8)
+        assert ohlc[-1, 4] == 100.5
+
+        client.api.query_public.return_value = {'error': ['EGeneral:Invalid']}
+        assert client.get_ohlc().shape == (0, 8)
+
+
+class TestTrailingStop:
+    """
+    Test TrailingStop per-tick updates
+    """
+
+    def test_update_returns_mutable_fields_only(self):
+        """update() returns a TSUpdate and only ratchets the stop upwards"""
+        from app.services.trailing_stop import TrailingStop, TSUpdate
+
+        ts = TrailingStop(entry_price=100.0, trailing_percentage=0.99)
+        tick = ts.update(110.0)
+        assert isinstance(tick, TSUpdate)
+        assert tick.trailing_stop == pytest.approx(108.9)
+        assert tick.distance_to_stop == pytest.approx(1.1)
+        assert tick.should_sell is False
+
+        tick = ts.update(105.0)
+        assert tick.trailing_stop == pytest.approx(108.9)
+        assert tick.should_sell is True
+        assert ts.stop_percentage(105.0) == pytest.approx((105.0 - 108.9) / 108.9 * 100)
+
+    def test_slots_and_round_trip(self):
+        """TrailingStop has no __dict__ and survives to_dict/from_dict"""
+        from app.services.trailing_stop import TrailingStop
+
+        ts = TrailingStop(entry_price=100.0)
+        ts.update(120.0)
+        assert not hasattr(ts, '__dict__')
+        restored = TrailingStop.from_dict(ts.to_dict())
+        assert restored.to_dict() == ts.to_dict()
+
+
+class TestBotConfig:
+    """
+    TradingBot settings live in a frozen, slotted BotConfig
+    """
+
+    def test_config_is_frozen_and_slotted(self):
+        """Settings are read from bot.cfg and cannot be changed after init"""
+        import dataclasses
+        from app.services.trading_bot import TradingBot
+
+        bot = TradingBot(kraken_api_key="key", kraken_secret="secret", trade_amount_percent=50.0)
+
+        assert bot.cfg.trade_amount_percent == 50.0
+        assert not hasattr(bot, '__dict__')
+        assert not hasattr(bot.cfg, '__dict__')
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            bot.cfg.dry_run = True
+        assert 'secret' not in repr(bot.cfg)
+
+
+class TestCCXTClientThreads:
+    """
+    Test concurrent market-data calls never share one ccxt exchange at once
+    """
+
+    def test_public_and_private_calls_use_separate_exchanges(self):
+        """Candles/ticker go to the public exchange one at a time; balance to the private one"""
+        import threading
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+        from app.services.trading_bot import CCXTKrakenClient
+
+        client = CCXTKrakenClient()
+        active, peak = [0], [0]
+        guard = threading.Lock()
+
+        def busy(result):
+            def call(*args, **kwargs):
+                with guard:
+                    active[0] += 1
+                    peak[0] = max(peak[0], active[0])
+                time.sleep(0.05)
+                with guard:
+                    active[0] -= 1
+                return result
+            return call
+
+        client.public = Mock()
+        client.public.fetch_ohlcv.side_effect = busy([[0, 1, 1, 1, 1, 1]])
+        client.public.fetch_ticker.side_effect = busy(
+            {'last': 1.0, 'bid': 1.0, 'ask': 1.0, 'baseVolume': 1.0, 'timestamp': 0})
+        client.exchange = Mock()
+        client.exchange.fetch_balance.return_value = {'BTC': {'free': 0.5}, 'USD': {'free': 10}}
+
+        with ThreadPoolExecutor(4) as pool:
+            calls = [pool.submit(client.get_ohlcv), pool.submit(client.get_ticker),
+                     pool.submit(client.get_ohlcv), pool.submit(client.get_balance)]
+            results = [call.result() for call in calls]
+
+        assert peak[0] == 1
+        assert results[3]['btc'] == 0.5
+        client.exchange.fetch_ohlcv.assert_not_called()
+        client.public.fetch_balance.assert_not_called()
+
 
 # ============================================================================
 # RUN TESTS
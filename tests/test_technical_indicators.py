@@ -0,0 +1,63 @@
+"""
+Tests para indicadores técnicos (kernels vs referencia pandas)
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from app.services.technical_indicators import TechnicalIndicators
+
+
+@pytest.fixture
+def prices():
+    """Serie de precios tipo BTC (random walk determinista)"""
+    rng = np.random.default_rng(42)
+    return list(50000 + np.cumsum(rng.normal(0, 500, 300)))
+
+
+def test_ema_matches_pandas(prices):
+    """EMA igual a pandas ewm(adjust=False)"""
+    expected = pd.Series(prices).ewm(span=20, adjust=False).mean().to_numpy()
+    np.testing.assert_allclose(TechnicalIndicators.calculate_ema(prices, 20), expected, rtol=1e-12)
+
+
+def test_rsi_matches_pandas(prices):
+    """RSI (medias simples) igual a la versión pandas, incluyendo NaN iniciales"""
+    delta = pd.Series(prices).diff()
+    gain = delta.where(delta > 0, 0).rolling(window=14).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
+    expected = (100 - 100 / (1 + gain / loss)).to_numpy()
+
+    np.testing.assert_allclose(TechnicalIndicators.calculate_rsi(prices, 14), expected, atol=1e-9)
+
+
+def test_rsi_last_matches_series(prices):
+    """RSI actual (solo último valor) igual al último de la serie; precios planos = 50"""
+    assert TechnicalIndicators.calculate_rsi_last(prices, 14) == pytest.approx(
+        TechnicalIndicators.calculate_rsi(prices, 14)[-1], abs=1e-9)
+    assert TechnicalIndicators.calculate_rsi_last([100.0] * 30, 14) == 50.0
+
+
+def test_macd_and_bollinger_match_pandas(prices):
+    """MACD y Bandas de Bollinger iguales a pandas"""
+    series = pd.Series(prices)
+    macd = series.ewm(span=12, adjust=False).mean() - series.ewm(span=26, adjust=False).mean()
+    signal = macd.ewm(span=9, adjust=False).mean()
+    middle = series.rolling(window=20).mean()
+    std = series.rolling(window=20).std()
+
+    macd_line, signal_line, histogram = TechnicalIndicators.calculate_macd(prices)
+    np.testing.assert_allclose(macd_line, macd.to_numpy(), atol=1e-8)
+    np.testing.assert_allclose(signal_line, signal.to_numpy(), atol=1e-8)
+    np.testing.assert_allclose(histogram, (macd - signal).to_numpy(), atol=1e-8)
+
+    upper, mid, lower = TechnicalIndicators.calculate_bollinger_bands(prices)
+    np.testing.assert_allclose(upper, (middle + 2 * std).to_numpy(), atol=1e-6)
+    np.testing.assert_allclose(mid, middle.to_numpy(), atol=1e-6)
+    np.testing.assert_allclose(lower, (middle - 2 * std).to_numpy(), atol=1e-6)
+
+
+def test_analyze_signals_accepts_array(prices):
+    """analyze_signals acepta lista o ndarray con el mismo resultado"""
+    assert TechnicalIndicators.analyze_signals(prices) == \
+        TechnicalIndicators.analyze_signals(np.asarray(prices))